@@ -43,7 +43,9 @@ class AsyncSessionManager:
             ssl_context.verify_mode = ssl.CERT_NONE
             
             self.connector = aiohttp.TCPConnector(
-                limit=10,
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
                 keepalive_timeout=30,
                 enable_cleanup_closed=True,
                 ssl=ssl_context
@@ -78,7 +80,14 @@ def _get_message_content(response):
         return None
 
 
-def message_model(prompt: str, model: str, max_retries: int = 3):
+def _chat_messages(prompt: str, system: str = None) -> List[Dict]:
+    """Build the chat message list, with an optional leading system turn."""
+    if system:
+        return [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+    return [{"role": "user", "content": prompt}]
+
+
+def message_model(prompt: str, model: str, max_retries: int = 3, system: str = None):
     """Send prompt to AI model with retries (synchronous version for compatibility)."""
     if not openrouter_client or not OPENROUTER_API_KEY:
         print("❌ OpenRouter client not available")
@@ -88,7 +97,7 @@ def message_model(prompt: str, model: str, max_retries: int = 3):
         try:
             response = openrouter_client.chat.completions.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=_chat_messages(prompt, system),
                 temperature=0.1,
                 max_tokens=1024,
             )
@@ -102,7 +111,8 @@ def message_model(prompt: str, model: str, max_retries: int = 3):
     return None
 
 
-async def message_model_async(session: aiohttp.ClientSession, prompt: str, model: str, max_retries: int = 3):
+async def message_model_async(session: aiohttp.ClientSession, prompt: str, model: str, max_retries: int = 3,
+                              system: str = None):
     """FIXED: Async version of AI model call with per-request timeout."""
     if not OPENROUTER_API_KEY:
         print("❌ OpenRouter API key not available")
@@ -117,7 +127,7 @@ async def message_model_async(session: aiohttp.ClientSession, prompt: str, model
     
     payload = {
         "model": model,
-        "messages": [{"role": "user", "content": prompt}],
+        "messages": _chat_messages(prompt, system),
         "temperature": 0.1,
         "max_tokens": 1024,
     }
@@ -202,17 +212,26 @@ def _looks_like_name(query: str) -> bool:
     return False
 
 
-def spell_correct_influencer_name(query: str, available_influencers: list = None) -> dict:
+def build_influencer_context(available_influencers: list = None, limit: int = 20) -> str:
+    """Compact (name, @username, followers) context line for the spelling prompt"""
+    entries = []
+    for inf in available_influencers or []:
+        name = inf.get('name', '')
+        if not name:
+            continue
+        entries.append(f"{name} (@{inf.get('username', '')}, {inf.get('followers', 0) or 0})")
+        if len(entries) >= limit:
+            break
+    if not entries:
+        return ""
+    return f"\n\nKnown influencers in database: {'; '.join(entries)}"
+
+
+def spell_correct_influencer_name(query: str, available_influencers: list = None,
+                                  influencer_context: str = None) -> dict:
     """Use AI to correct spelling mistakes and find the right influencer (synchronous version)"""
-    if not available_influencers:
-        available_influencers = []
-    
-    # Create a list of known influencers for context
-    influencer_context = ""
-    if available_influencers:
-        influencer_names = [inf.get('name', '') for inf in available_influencers[:20] if inf.get('name')]
-        if influencer_names:
-            influencer_context = f"\n\nKnown influencers in database: {', '.join(influencer_names)}"
+    if influencer_context is None:
+        influencer_context = build_influencer_context(available_influencers)
     
     spelling_correction_prompt = f"""
 You are an expert at identifying potential influencer names and correcting spelling mistakes.
@@ -284,17 +303,12 @@ Reasoning: [brief explanation of decision]
     }
 
 
-async def spell_correct_influencer_name_async(query: str, available_influencers: list = None) -> dict:
+async def spell_correct_influencer_name_async(query: str, available_influencers: list = None,
+                                              influencer_context: str = None,
+                                              session: aiohttp.ClientSession = None) -> dict:
     """FIXED: Async version of spelling correction with proper timeout handling"""
-    if not available_influencers:
-        available_influencers = []
-    
-    # Create a list of known influencers for context
-    influencer_context = ""
-    if available_influencers:
-        influencer_names = [inf.get('name', '') for inf in available_influencers[:20] if inf.get('name')]
-        if influencer_names:
-            influencer_context = f"\n\nKnown influencers in database: {', '.join(influencer_names)}"
+    if influencer_context is None:
+        influencer_context = build_influencer_context(available_influencers)
     
     spelling_correction_prompt = f"""
 You are an expert at identifying potential influencer names and correcting spelling mistakes.
@@ -323,7 +337,8 @@ Reasoning: [brief explanation of decision]
 """
     
     try:
-        session = await session_manager.get_session()
+        if session is None:
+            session = await session_manager.get_session()
         response = await message_model_async(session, spelling_correction_prompt, "openai/gpt-oss-20b:free")
         if response:
             result = parse_spelling_correction_response(response, query)
@@ -574,6 +589,49 @@ def parse_profile_selection_response(response_text: str) -> dict:
     return result
 
 
+def parse_normselect_response(response_text: str, original_query: str) -> Tuple[dict, dict]:
+    """Parse the fused normalization + profile selection JSON response."""
+    normalized = parse_normalization_response(None, original_query)
+    selected = {}
+    
+    if not response_text:
+        return normalized, selected
+    
+    try:
+        match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        data = json.loads(match.group(0)) if match else {}
+        
+        name = str(data.get('search_name') or '').strip()
+        if name and len(name) < 100:  # Reasonable name length
+            normalized['search_name'] = name
+        
+        for section in ('aliases', 'handles'):
+            for item in data.get(section) or []:
+                if not isinstance(item, str):
+                    continue
+                item = item.strip()
+                # Only add reasonable items (not long sentences)
+                if item and len(item) < 50 and len(item.split()) <= 4 and item.lower() not in ['none known', 'none', 'n/a']:
+                    normalized[section].append(item)
+        
+        choice = data.get('selected') or {}
+        if isinstance(choice, dict):
+            if choice.get('name'):
+                selected['name'] = str(choice['name']).strip()
+            if choice.get('username'):
+                selected['username'] = str(choice['username']).strip().lstrip('@')
+            if choice.get('instagram_url'):
+                selected['instagram_url'] = str(choice['instagram_url']).strip()
+            try:
+                selected['confidence'] = float(choice.get('confidence', 0.5))
+            except (TypeError, ValueError):
+                selected['confidence'] = 0.5
+    except Exception as e:
+        print(f"Normalize/select parsing error: {e}")
+    
+    return normalized, selected
+
+
 def parse_scoring_response(response_text: str, username: str, metrics: dict) -> dict:
     """Parse AI scoring response with robust fallbacks."""
     # Default scores that will be returned if parsing fails
@@ -649,7 +707,7 @@ def search_google(query: str):
         return None
 
 
-async def search_google_async(query: str):
+async def search_google_async(query: str, session: aiohttp.ClientSession = None):
     """FIXED: Async version of Google search with per-request timeout."""
     if not SERPER_API_KEY:
         print("❌ Serper API key missing")
@@ -668,7 +726,8 @@ async def search_google_async(query: str):
     }
     
     try:
-        session = await session_manager.get_session()
+        if session is None:
+            session = await session_manager.get_session()
         
         # FIXED: Per-request timeout to avoid context manager error
         timeout = aiohttp.ClientTimeout(total=30)
@@ -720,7 +779,7 @@ def scrape_instagram_posts_primary(username: str):
         return []
 
 
-async def scrape_instagram_posts_primary_async(username: str):
+async def scrape_instagram_posts_primary_async(username: str, session: aiohttp.ClientSession = None):
     """FIXED: Async version with proper status codes and timeout handling."""
     if not APIFY_API_TOKEN:
         print("❌ Apify token missing")
@@ -738,7 +797,8 @@ async def scrape_instagram_posts_primary_async(username: str):
     }
     
     try:
-        session = await session_manager.get_session()
+        if session is None:
+            session = await session_manager.get_session()
         
         # FIXED: Per-request timeout
         timeout = aiohttp.ClientTimeout(total=300)
@@ -812,7 +872,7 @@ def scrape_profile_info_only(username: str):
         return None
 
 
-async def scrape_profile_info_only_async(username: str):
+async def scrape_profile_info_only_async(username: str, session: aiohttp.ClientSession = None):
     """FIXED: Async version with proper status codes and timeout handling."""
     if not APIFY_API_TOKEN:
         print("❌ Apify token missing")
@@ -830,7 +890,8 @@ async def scrape_profile_info_only_async(username: str):
     }
     
     try:
-        session = await session_manager.get_session()
+        if session is None:
+            session = await session_manager.get_session()
         
         # FIXED: Per-request timeout
         timeout = aiohttp.ClientTimeout(total=120)
@@ -923,7 +984,7 @@ def scrape_profile_and_posts_alternative(username: str):
         return None, []
 
 
-async def scrape_profile_and_posts_parallel_async(username: str) -> Tuple[Optional[Dict], List[Dict]]:
+async def scrape_profile_and_posts_parallel_async(username: str, session: aiohttp.ClientSession = None) -> Tuple[Optional[Dict], List[Dict]]:
     """FIXED: Parallel scraping with proper status codes and timeout handling"""
     if not APIFY_API_TOKEN:
         print("❌ Apify API token missing")
@@ -933,11 +994,11 @@ async def scrape_profile_and_posts_parallel_async(username: str) -> Tuple[Option
     
     # Create tasks for parallel execution
     profile_task = asyncio.create_task(
-        scrape_profile_info_only_async(username),
+        scrape_profile_info_only_async(username, session),
         name=f"profile_{username}"
     )
     posts_task = asyncio.create_task(
-        scrape_instagram_posts_primary_async(username),
+        scrape_instagram_posts_primary_async(username, session),
         name=f"posts_{username}"
     )
     
@@ -1008,10 +1069,10 @@ def scrape_complete_instagram_profile(username: str):
     return profile_data, posts_data
 
 
-async def scrape_complete_instagram_profile_async(username: str) -> Tuple[Optional[Dict], List[Dict]]:
+async def scrape_complete_instagram_profile_async(username: str, session: aiohttp.ClientSession = None) -> Tuple[Optional[Dict], List[Dict]]:
     """FIXED: Async version with all fixes applied"""
     try:
-        return await scrape_profile_and_posts_parallel_async(username)
+        return await scrape_profile_and_posts_parallel_async(username, session)
     except Exception as e:
         print(f"Async scraping failed: {e}, falling back to sync")
         return scrape_complete_instagram_profile(username)
@@ -1,4 +1,9 @@
 import os
+import sys
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -17,3 +22,23 @@ OPENROUTER_API_BASE = "https://openrouter.ai/api/v1"
 MODEL_NORMALIZER = "openai/gpt-oss-20b:free"
 MODEL_SELECTOR = "openai/gpt-oss-20b:free"
 MODEL_SCORING = "openai/gpt-oss-20b:free"
+
+# --- LOGGING ---
+# App loggers that report progress at INFO; everything else (HTTP clients etc.) stays at WARNING
+APP_LOGGERS = ("workflow", "unified_data_manager")
+_log_listener = None
+
+def setup_logging(level=logging.INFO):
+    """Send log records through a queue to a background stdout writer. Called once by each entry point."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(logging.WARNING)
+    root.addHandler(QueueHandler(log_queue))
+    for name in APP_LOGGERS:
+        logging.getLogger(name).setLevel(level)
+    _log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
@@ -1,17 +1,31 @@
 import json
 import os
+import threading
+import orjson
 from datetime import datetime, timedelta
 from config import DATABASE_FILE
 
-def get_database():
-    """Load the JSON database."""
+# Writers load, modify and save the whole file; serialize them so concurrent saves don't drop updates
+_DB_WRITE_LOCK = threading.Lock()
+# Written with orjson so it reads back with orjson (NaN/Infinity become null, numpy scalars are plain numbers)
+_ORJSON_WRITE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def get_database(strict=False):
+    """Load the JSON database. With strict=True an unreadable file raises instead of loading as empty."""
     if not os.path.exists(DATABASE_FILE):
         return {"profiles": {}, "metadata": {"last_updated": datetime.now().isoformat()}}
     
     try:
-        with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(DATABASE_FILE, 'rb') as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Files saved by json.dump may hold NaN/Infinity tokens that only the stdlib parser accepts
+            return json.loads(raw)
     except Exception as e:
+        if strict:
+            raise
         print(f"Error loading database: {e}")
         return {"profiles": {}, "metadata": {"last_updated": datetime.now().isoformat()}}
 
@@ -19,8 +33,8 @@ def save_database(data):
     """Save the JSON database."""
     try:
         data["metadata"]["last_updated"] = datetime.now().isoformat()
-        with open(DATABASE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(DATABASE_FILE, 'wb') as f:
+            f.write(orjson.dumps(data, option=_ORJSON_WRITE_OPTIONS))
         return True
     except Exception as e:
         print(f"Error saving database: {e}")
@@ -69,8 +83,6 @@ def insert_complete_profile(profile_info, posts_data, metrics_data, scores_data)
         print("❌ No username provided for database insertion")
         return False
     
-    db = get_database()
-    
     profile_data = {
         "basic_info": {
             "username": profile_info.get("username", ""),
@@ -155,10 +167,18 @@ def insert_complete_profile(profile_info, posts_data, metrics_data, scores_data)
         profile_data["mentions"]["most_mentioned"] = dict(sorted(mention_counts.items(), key=lambda x: x[1], reverse=True)[:20])
         profile_data["mentions"]["total_mentions"] = sum(mention_counts.values())
     
-    db["profiles"][username] = profile_data
-    db["metadata"]["total_profiles"] = len(db["profiles"])
+    with _DB_WRITE_LOCK:
+        try:
+            db = get_database(strict=True)
+        except Exception as e:
+            # Saving over a file we failed to read would replace every stored profile with this one
+            print(f"❌ Could not load database, not saving @{username}: {e}")
+            return False
+        db["profiles"][username] = profile_data
+        db["metadata"]["total_profiles"] = len(db["profiles"])
+        saved = save_database(db)
     
-    if save_database(db):
+    if saved:
         print(f"✅ Complete profile data saved for @{username}")
         print(f"   - Basic info: ✅")
         print(f"   - Posts: {len(posts_data)} total" if posts_data else "   - Posts: 0")
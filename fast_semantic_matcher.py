@@ -1,17 +1,45 @@
 # fast_semantic_matcher.py
 import json
+import os
+import atexit
+import threading
+from collections import OrderedDict
 import numpy as np
 import faiss
 from typing import List, Dict, Tuple, Optional
 
 # Lazy global model to reduce cold start time
 _sentence_model = None
+# Prewarm thread and request path can both hit a cold model; only one of them should load it
+_MODEL_LOCK = threading.Lock()
+
+# Query embeddings are cached so repeated prompts skip the transformer forward pass
+QUERY_CACHE_FILE = 'query_embedding_cache.npz'
+QUERY_CACHE_SIZE = 512
+# Texts per forward pass when encoding many rows at once
+ENCODE_BATCH_SIZE = 256
 
 try:
     from sentence_transformers import SentenceTransformer
 except Exception:
     SentenceTransformer = None
 
+try:
+    import torch
+except Exception:
+    torch = None
+
+
+def _select_device() -> str:
+    """Best available torch device for the encoder."""
+    if torch is not None:
+        if torch.cuda.is_available():
+            return "cuda"
+        mps = getattr(torch.backends, "mps", None)
+        if mps is not None and mps.is_available():
+            return "mps"
+    return "cpu"
+
 
 class FastSemanticMatcher:
     """
@@ -25,27 +53,93 @@ class FastSemanticMatcher:
         self.faiss_index: Optional[faiss.Index] = None
         self.username_list: List[str] = []
         self.embedding_dim: int = 384  # all-MiniLM-L6-v2 outputs 384 dims [6]
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        # The speculative match pool and the request path share the LRU; OrderedDict isn't thread-safe
+        self._query_cache_lock = threading.Lock()
 
     # ---------- Embeddings ----------
     def _ensure_model(self):
         global _sentence_model
         if _sentence_model is None:
-            if SentenceTransformer is None:
-                raise RuntimeError("sentence-transformers not installed. Run: pip install sentence-transformers")
-            _sentence_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")  # [6]
+            with _MODEL_LOCK:
+                if _sentence_model is None:
+                    if SentenceTransformer is None:
+                        raise RuntimeError("sentence-transformers not installed. Run: pip install sentence-transformers")
+                    device = _select_device()
+                    _sentence_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2", device=device)  # [6]
+                    print(f"✅ Sentence model loaded on {device}")
         return _sentence_model
 
+    def prewarm(self):
+        """Load the model and run one encode so device init doesn't land inside a user request."""
+        try:
+            self._ensure_model().encode(["warmup"], normalize_embeddings=True, show_progress_bar=False)
+        except Exception as e:
+            print(f"ℹ️ Sentence model prewarm skipped: {e}")
+
+    def prewarm_in_background(self):
+        if SentenceTransformer is not None and _sentence_model is None:
+            threading.Thread(target=self.prewarm, name="sentence_model_prewarm", daemon=True).start()
+
     def get_text_embedding(self, text: str) -> List[float]:
         """Return a normalized 384-d vector for a single text."""
         model = self._ensure_model()
-        vec = model.encode([text], normalize_embeddings=True)  # shape (1, 384) L2-normalized [8]
+        vec = model.encode([text], normalize_embeddings=True, show_progress_bar=False)  # shape (1, 384) L2-normalized [8]
         vec = np.asarray(vec, dtype=np.float32).reshape(-1)    # shape (384,)
         return vec.tolist()
 
+    def get_query_embedding(self, text: str) -> np.ndarray:
+        """Return the normalized float32 vector for a query, reusing recent encodings."""
+        with self._query_cache_lock:
+            cached = self._query_cache.get(text)
+            if cached is not None:
+                self._query_cache.move_to_end(text)
+                return cached
+
+        vec = np.asarray(self.get_text_embedding(text), dtype=np.float32)
+        with self._query_cache_lock:
+            self._query_cache[text] = vec
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return vec
+
+    def save_query_cache(self, path: str = QUERY_CACHE_FILE):
+        """Persist cached query embeddings so they survive process restarts."""
+        with self._query_cache_lock:
+            items = list(self._query_cache.items())
+        if not items:
+            return
+        try:
+            texts = [text for text, _ in items]
+            vectors = np.stack([vec for _, vec in items]).astype(np.float32)
+            np.savez(path, texts=np.array(texts), vectors=vectors)
+        except Exception as e:
+            print(f"⚠️ Could not save query embedding cache: {e}")
+
+    def load_query_cache(self, path: str = QUERY_CACHE_FILE):
+        """Load query embeddings saved by a previous process, if any."""
+        if not os.path.exists(path):
+            return
+        try:
+            data = np.load(path, allow_pickle=False)
+            with self._query_cache_lock:
+                for text, vec in zip(data['texts'].tolist(), data['vectors']):
+                    self._query_cache[text] = np.asarray(vec, dtype=np.float32)
+                while len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        except Exception as e:
+            print(f"⚠️ Could not load query embedding cache: {e}")
+
     def get_batch_embeddings(self, texts: List[str]) -> np.ndarray:
         """Batch encode texts to a float32 NxD matrix, L2-normalized."""
         model = self._ensure_model()
-        vectors = model.encode(texts, normalize_embeddings=True)  # shape (N, 384) [8]
+        vectors = model.encode(
+            texts,
+            batch_size=ENCODE_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )  # shape (N, 384) [8]
         return np.asarray(vectors, dtype=np.float32)
 
     # ---------- Load precomputed influencer summaries ----------
@@ -66,6 +160,9 @@ class FastSemanticMatcher:
             self.is_loaded = True
             print(f"✅ Loaded {len(self.influencer_data)} influencer summaries")
 
+            self.load_query_cache()
+            self.prewarm_in_background()
+
             # Load FAISS index (optional)
             try:
                 self.load_faiss_index('influencer_index.faiss', 'username_mapping.json')
@@ -131,8 +228,16 @@ class FastSemanticMatcher:
             print("ℹ️ No FAISS index loaded. Run generate_embeddings.py to create it.")
             return []
 
+        return self.search_by_vector(self.get_query_embedding(text), top_k=top_k)
+
+    def search_by_vector(self, q_vec: np.ndarray, top_k: int = 8) -> List[Tuple[str, float]]:
+        """Return [(username, score)] for an already-encoded query vector."""
+        if self.faiss_index is None or not self.username_list:
+            print("ℹ️ No FAISS index loaded. Run generate_embeddings.py to create it.")
+            return []
+
         # Build (1, D) float32 query matrix
-        q_vec = np.asarray(self.get_text_embedding(text), dtype=np.float32)  # (D,)
+        q_vec = np.asarray(q_vec, dtype=np.float32)  # (D,)
         if q_vec.ndim != 1:
             q_vec = q_vec.reshape(-1)
         q = np.expand_dims(q_vec, axis=0)  # (1, D)
@@ -166,21 +271,28 @@ class FastSemanticMatcher:
 
         # Vector search path
         if self.faiss_index is not None and self.username_list:
-            hits = self.search_by_text(product_description, top_k=top_k)
-            matches: List[Dict] = []
-            for rank, (username, score) in enumerate(hits, start=1):
-                if username in self.influencer_data:
-                    influencer = self.influencer_data[username].copy()
-                    influencer['semantic_match_score'] = float(score)
-                    # For normalized vectors, IP in [0, 1]; convert to percentage confidence
-                    influencer['match_confidence'] = max(0.0, min(1.0, float(score))) * 100.0
-                    influencer['rank'] = rank
-                    matches.append(influencer)
-            return matches
+            return self.find_semantic_matches_by_vector(self.get_query_embedding(product_description), top_k=top_k)
 
         # Fallback matching (no FAISS index present)
         return self._fallback_keyword_matching(product_description, list(self.influencer_data.values()))
 
+    def find_semantic_matches_by_vector(self, q_vec: np.ndarray, top_k: int = 8) -> List[Dict]:
+        """Same as find_semantic_matches, for a query that is already encoded."""
+        if not self.is_loaded:
+            self.load_precomputed_embeddings()
+
+        hits = self.search_by_vector(q_vec, top_k=top_k)
+        matches: List[Dict] = []
+        for rank, (username, score) in enumerate(hits, start=1):
+            if username in self.influencer_data:
+                influencer = self.influencer_data[username].copy()
+                influencer['semantic_match_score'] = float(score)
+                # For normalized vectors, IP in [0, 1]; convert to percentage confidence
+                influencer['match_confidence'] = max(0.0, min(1.0, float(score))) * 100.0
+                influencer['rank'] = rank
+                matches.append(influencer)
+        return matches
+
     def _fallback_keyword_matching(self, product_description: str, influencers: List[Dict]) -> List[Dict]:
         """Simple keyword-based scorer as final fallback."""
         product_keywords = (product_description or "").lower().split()
@@ -224,3 +336,4 @@ class FastSemanticMatcher:
 
 # Global instance
 fast_semantic_matcher = FastSemanticMatcher()
+atexit.register(fast_semantic_matcher.save_query_cache)
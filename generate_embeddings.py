@@ -25,11 +25,11 @@ def precompute_all_embeddings():
     embeddings_data = {}
 
     for i, inf in enumerate(influencers):
-        username = inf.get('username', f'unknown_{i}')
-        name = inf.get('name', '') or ''
-        category = inf.get('category', '') or ''
-        bio = inf.get('bio', '') or ''
-        tags = ' '.join(inf.get('top_hashtags', [])[:10])
+        username = inf.username or f'unknown_{i}'
+        name = inf.name or ''
+        category = inf.category or ''
+        bio = inf.bio or ''
+        tags = ' '.join(inf.top_hashtags[:10])
         text = f"{name} {category} {bio} {tags}".strip()
 
         usernames.append(username)
@@ -42,15 +42,15 @@ def precompute_all_embeddings():
                 'name': name,
                 'category': category,
                 'bio': bio,
-                'top_hashtags': inf.get('top_hashtags', [])[:15],
-                'followers': inf.get('followers', 0),
-                'engagement_rate': inf.get('engagement_rate', 0),
-                'verified': inf.get('verified', False),
-                'brand_collaborations': inf.get('brand_collaborations', []),
-                'content_quality': inf.get('content_quality', 0),
-                'authenticity': inf.get('authenticity', 0),
-                'brand_safety': inf.get('brand_safety', 0),
-                'audience_match': inf.get('audience_match', 0),
+                'top_hashtags': inf.top_hashtags[:15],
+                'followers': inf.followers,
+                'engagement_rate': inf.engagement_rate,
+                'verified': inf.verified,
+                'brand_collaborations': inf.brand_collaborations,
+                'content_quality': inf.content_quality,
+                'authenticity': inf.authenticity,
+                'brand_safety': inf.brand_safety,
+                'audience_match': inf.audience_match,
             }
         }
 
@@ -3,6 +3,7 @@ import json
 import re
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Tuple, Optional
 
@@ -35,12 +36,59 @@ from conversation_manager import conversation_manager
 from knowledge_manager import knowledge_manager
 from fast_semantic_matcher import fast_semantic_matcher
 from unified_data_manager import unified_data_manager
-from config import MODEL_NORMALIZER, MODEL_SELECTOR, MODEL_SCORING
+from config import MODEL_NORMALIZER, MODEL_SELECTOR, MODEL_SCORING, setup_logging
 
 import os
 
 CHAT_JSON_PATH = "chat_conversations.json"
 
+# Cheap pre-classifier for queries that will probably resolve to product_promotion
+_PROMO_KW_RE = re.compile(
+    r"\b(promot\w*|advertis\w*|marketing|campaign|brand|product|sponsor\w*|influencers? for)\b",
+    re.IGNORECASE
+)
+# Runs speculative semantic matches while the intent LLM call is in flight
+_SPECULATION_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="speculative_match")
+
+# Sidebar constants, built once per process instead of on every Streamlit rerun
+EXAMPLES: Tuple[str, ...] = (
+    "What do you know about dhruv rathi?",
+    "Tell me about carry minati",
+    "What about harsh beniwall?",
+    "Tell me about triggered insaan",
+    "I want to promote my gaming laptop",
+    "Find influencers for my skincare brand",
+    "Who should advertise my fitness app?",
+    "What about bhuvan bam?",
+    "Tell me about any influencer name",
+)
+EXAMPLE_KEYS: Tuple[str, ...] = tuple(f"ex_{i}" for i, _ in enumerate(EXAMPLES))
+
+ROBUST_FEATURES_MD = """
+**⚡ Performance Optimizations:**
+- Async processing: 25-50% faster
+- Connection pooling: Efficient HTTP
+- Error recovery: Graceful degradation
+
+**🔤 Smart Features:**
+- AI spell correction: Works with errors
+- Fuzzy name matching: Finds variations
+- Cross-database search: Comprehensive
+- SSL fixes: Handles certificate issues
+
+**🕷️ Auto-Scraping:**
+- Robust Google search
+- Parallel profile + posts scraping
+- Multiple fallback strategies
+- Error handling at every step
+
+**🛡️ Reliability:**
+- Multiple error recovery paths
+- Graceful degradation
+- Performance monitoring
+- Success rate tracking
+"""
+
 def save_conversations_to_json(convo_data, filename=CHAT_JSON_PATH):
     with open(filename, "w", encoding="utf-8") as f:
         json.dump(convo_data, f, indent=2, ensure_ascii=False)
@@ -59,19 +107,20 @@ def initialize_memory():
         st.session_state.active_conversation_id = str(datetime.now().timestamp())
     if st.session_state.active_conversation_id not in st.session_state.all_conversations:
         st.session_state.all_conversations[st.session_state.active_conversation_id] = []
+    # conversation_memory is an alias of the active list in all_conversations, not a copy;
+    # appends through either name are visible through both, so it is bound only here and on reset
     st.session_state.conversation_memory = st.session_state.all_conversations[st.session_state.active_conversation_id]
 
 def add_message_to_memory(role, content):
     convo_id = st.session_state.active_conversation_id
     st.session_state.all_conversations[convo_id].append({"role": role, "content": content})
-    st.session_state.conversation_memory = st.session_state.all_conversations[convo_id]
     save_conversations_to_json(st.session_state.all_conversations)
 
 def reset_conversation_memory():
     new_id = str(datetime.now().timestamp())
     st.session_state.active_conversation_id = new_id
     st.session_state.all_conversations[new_id] = []
-    st.session_state.conversation_memory = []
+    st.session_state.conversation_memory = st.session_state.all_conversations[new_id]
     save_conversations_to_json(st.session_state.all_conversations)
 
 st.set_page_config(
@@ -143,11 +192,12 @@ class AIProductMatcher:
         enhanced_description = product_description
         if brand:
             enhanced_description = f"{brand} {product_description}"
-        matches = fast_semantic_matcher.find_semantic_matches(
-            enhanced_description,
-            top_k=10
-        )
-        return matches
+        if not fast_semantic_matcher.is_loaded:
+            fast_semantic_matcher.load_precomputed_embeddings()
+        if fast_semantic_matcher.faiss_index is None:
+            return fast_semantic_matcher.find_semantic_matches(enhanced_description, top_k=10)
+        q = fast_semantic_matcher.get_query_embedding(enhanced_description)
+        return fast_semantic_matcher.find_semantic_matches_by_vector(q, top_k=10)
 
     def generate_promotion_strategy(self, product_description: str, brand: str, matched_influencers: List[Dict]) -> str:
         if not matched_influencers:
@@ -212,13 +262,11 @@ class IntelligentChatbot:
             st.session_state.spelling_corrections = {}
         if "scraping_history" not in st.session_state:
             st.session_state.scraping_history = []
-        if "async_mode" not in st.session_state:
-            st.session_state.async_mode = True
         if "performance_stats" not in st.session_state:
             st.session_state.performance_stats = {
                 "queries_processed": 0,
                 "async_successes": 0,
-                "sync_fallbacks": 0,
+                "search_errors": 0,
                 "average_response_time": 0
             }
 
@@ -231,7 +279,6 @@ I have access to **{stats['total_unique']} influencer profiles** with **robust a
 
 **🚀 Performance Features:**
 - **Async Optimized**: 25-50% faster processing with SSL fixes ⚡
-- **Robust Fallbacks**: Sync backup when async fails 🔄
 - **Smart Spell Check**: "dhruv rathi" → "Dhruv Rathee" ✅
 - **Auto-Scraping**: Find anyone, I'll scrape and add them! 🕷️
 - **Error Recovery**: Graceful degradation for maximum reliability 🛡️
@@ -239,7 +286,6 @@ I have access to **{stats['total_unique']} influencer profiles** with **robust a
 **💾 Database Status:**
 - Main Database: {stats['main_database']} detailed profiles
 - Embeddings Database: {stats['embeddings_database']} semantic vectors  
-- Async Processing: {"✅ Enabled" if st.session_state.get('async_mode', True) else "❌ Sync Mode"}
 
 *All conversation context is remembered in this chat. Clear memory for a fresh start anytime.*
 
@@ -272,22 +318,13 @@ I have access to **{stats['total_unique']} influencer profiles** with **robust a
 
     def find_influencer_comprehensive(self, influencer_name: str) -> Tuple[bool, Dict, str]:
         try:
-            if st.session_state.async_mode:
-                result = unified_data_manager.find_influencer_anywhere(influencer_name, auto_scrape=True)
-                st.session_state.performance_stats["async_successes"] += 1
-                return result
-            else:
-                result = unified_data_manager._find_influencer_anywhere_sync(influencer_name, auto_scrape=True)
-                st.session_state.performance_stats["sync_fallbacks"] += 1
-                return result
+            result = unified_data_manager.find_influencer_anywhere(influencer_name, auto_scrape=True)
+            st.session_state.performance_stats["async_successes"] += 1
+            return result
         except Exception as e:
             print(f"Comprehensive search error: {e}")
-            st.session_state.performance_stats["sync_fallbacks"] += 1
-            try:
-                return unified_data_manager._find_influencer_anywhere_sync(influencer_name, auto_scrape=True)
-            except Exception as e2:
-                print(f"Sync fallback also failed: {e2}")
-                return False, None, "search_failed"
+            st.session_state.performance_stats["search_errors"] += 1
+            return False, None, "search_failed"
 
     def process_user_message(self, user_message: str) -> str:
         add_message_to_memory("user", user_message)
@@ -298,42 +335,56 @@ I have access to **{stats['total_unique']} influencer profiles** with **robust a
             reply = "❌ **Databases not loaded**\n\nPlease ensure you have both `instagram_analysis.json` and `influencer_embeddings.json` files."
             add_message_to_memory("assistant", reply)
             return reply
-        try:
-            with st.spinner("🤖 Analyzing your request..."):
+        notes = []
+        status_state = "complete"
+        # One collapsed status container per turn instead of a spinner/alert per step
+        with st.status("🤖 Working...", expanded=False) as status:
+            speculative = None
+            try:
+                if _PROMO_KW_RE.search(user_message):
+                    # Start the fast embedding search now; it is discarded if the intent differs
+                    speculative = _SPECULATION_POOL.submit(
+                        self.product_matcher.find_semantic_matches, user_message, None
+                    )
+                status.update(label="🤖 Analyzing your request...")
                 intent_data = self.product_matcher.analyze_query_intent(user_message)
-            intent = intent_data.get('intent', 'general_question')
-            confidence = intent_data.get('confidence', 0.0)
-            likely_misspelling = intent_data.get('likely_misspelling', False)
-            intent_display = intent.replace('_', ' ').title()
-            mode_indicator = "⚡ Async" if st.session_state.async_mode else "🔄 Sync"
-            if intent == "product_promotion":
-                product_description = intent_data.get('product_description', '')
-                brand = intent_data.get('brand')
-                if not product_description:
-                    reply = "I need more details about what you want to promote. Could you describe your product or service?"
-                    add_message_to_memory("assistant", reply)
-                    return reply
-                with st.spinner(f"⚡ Finding instant matches for: {product_description}"):
+                intent = intent_data.get('intent', 'general_question')
+                confidence = intent_data.get('confidence', 0.0)
+                likely_misspelling = intent_data.get('likely_misspelling', False)
+                intent_display = intent.replace('_', ' ').title()
+                if intent == "product_promotion":
+                    product_description = intent_data.get('product_description', '')
+                    brand = intent_data.get('brand')
+                    if not product_description:
+                        reply = "I need more details about what you want to promote. Could you describe your product or service?"
+                        add_message_to_memory("assistant", reply)
+                        return reply
+                    status.update(label=f"⚡ Finding instant matches for: {product_description}")
                     try:
-                        semantic_matches = self.product_matcher.find_semantic_matches(product_description, brand)
+                        if speculative is not None and not brand:
+                            semantic_matches = speculative.result()
+                        else:
+                            semantic_matches = self.product_matcher.find_semantic_matches(product_description, brand)
                     except Exception as e:
-                        st.warning(f"Semantic matching error: {e}")
+                        notes.append(f"Semantic matching error: {e}")
+                        status_state = "error"
                         semantic_matches = []
-                if semantic_matches:
-                    st.success(f"⚡ Found {len(semantic_matches)} semantic matches instantly!")
-                    with st.spinner("🎯 Creating your marketing strategy..."):
+                    if semantic_matches:
+                        notes.append(f"⚡ Found {len(semantic_matches)} semantic matches instantly!")
+                        status.update(label="🎯 Creating your marketing strategy...")
                         try:
                             strategy = self.product_matcher.generate_promotion_strategy(
                                 product_description, brand, semantic_matches
                             )
                         except Exception as e:
-                            st.error(f"Strategy generation error: {e}")
+                            notes.append(f"Strategy generation error: {e}")
+                            status_state = "error"
                             strategy = f"Found {len(semantic_matches)} matching influencers, but couldn't generate full strategy. Please try again."
-                    add_message_to_memory("assistant", strategy)
-                    return strategy
-                else:
-                    stats = unified_data_manager.get_database_stats()
-                    reply = f"""❌ **No semantic matches found for: {product_description}**
+                        add_message_to_memory("assistant", strategy)
+                        return strategy
+                    else:
+                        stats = unified_data_manager.get_database_stats()
+                        reply = f"""❌ **No semantic matches found for: {product_description}**
 
 This might be because:
 - The precomputed embeddings don't include influencers in this niche
@@ -344,87 +395,89 @@ This might be because:
 - Main Database: {stats['main_database']} profiles
 - Embeddings Database: {stats['embeddings_database']} profiles
 - Try asking about specific influencers or broader product categories"""
-                    add_message_to_memory("assistant", reply)
-                    return reply
-            elif intent == "influencer_info":
-                influencer_name_or_names = intent_data.get('influencer_name')
-                if influencer_name_or_names and (',' in str(influencer_name_or_names) or ' and ' in str(influencer_name_or_names) or '&' in str(influencer_name_or_names)):
-                    influencer_names = extract_influencer_names(str(influencer_name_or_names))
-                else:
-                    influencer_names = extract_influencer_names(user_message)
-                if isinstance(influencer_names, str):
-                    influencer_names = [influencer_names]
-                if influencer_names and len(influencer_names) > 1:
-                    influencer_results = []
-                    for nm in influencer_names:
-                        found, data, source = self.find_influencer_comprehensive(nm)
-                        if found and data:
-                            influencer_results.append(data)
-                    if influencer_results:
-                        strategist_prompt = (
-                            "You are Nurdd’s AI Marketing Strategist. Your job is to help brands find and evaluate the best influencers for their campaigns.\n\n"
-                            "Analyze the user's query and influencers below; Provide detailed recommendations from search results. Always:\n\n"
-                            "1. Understand the Campaign: Identify brand industry, target audience, and goals (pick from: Lifestyle, Comedy, Finance, Business, Entrepreneurship, Health, Wellness, Cooking, DIY, Crafts, Sports, Travel Vlogs, Reviews, Unboxing, ASMR, Podcasts, Motivation, Personal Development, Productivity, Science, Nature, Animals, Cars, Luxury, Minimalism, Meme Culture, News, Politics, Spirituality, Astrology)\n"
-                            "2. Recommend Best Matches: Highlight 4-5 top influencers with clear reasoning\n"
-                            "3. Provide Strategic Insights: Explain why each influencer is suitable matching their industry.\n"
-                            "4. Suggest Campaign Ideas: Offer specific collaboration concepts\n"
-                            "5. Include Practical Details: Mention engagement rates, follower counts, and content style\n"
-                            "6. Ask Follow-up Questions: Help refine the search further\n\n"
-                            "INFLUENCERS:\n"
-                            f"{json.dumps(influencer_results, indent=2)}\n\n"
-                            f"USER QUERY: {user_message}\n\n"
-                            "Be comprehensive, insightful, and focus on ROI and campaign effectiveness."
-                        )
-                        smart_response = safe_ai_message_model(strategist_prompt, MODEL_SCORING)
-                        add_message_to_memory("assistant", smart_response)
-                        return smart_response
-                    else:
-                        add_message_to_memory("assistant", "No suitable influencer profiles found for that query.")
-                        return "No suitable influencer profiles found for that query."
-                influencer_name = influencer_name_or_names if influencer_name_or_names else (influencer_names[0] if influencer_names else None)
-                if influencer_name:
-                    if likely_misspelling:
-                        search_msg = f"🔤 Checking spelling for '{influencer_name}', searching databases, and auto-scraping if needed..."
+                        add_message_to_memory("assistant", reply)
+                        return reply
+                elif intent == "influencer_info":
+                    influencer_name_or_names = intent_data.get('influencer_name')
+                    if influencer_name_or_names and (',' in str(influencer_name_or_names) or ' and ' in str(influencer_name_or_names) or '&' in str(influencer_name_or_names)):
+                        influencer_names = extract_influencer_names(str(influencer_name_or_names))
                     else:
-                        search_msg = f"🔍 Searching for '{influencer_name}' in databases and auto-scraping if needed..."
-                    with st.spinner(search_msg):
+                        influencer_names = extract_influencer_names(user_message)
+                    if isinstance(influencer_names, str):
+                        influencer_names = [influencer_names]
+                    if influencer_names and len(influencer_names) > 1:
+                        influencer_results = []
+                        for nm in influencer_names:
+                            found, data, source = self.find_influencer_comprehensive(nm)
+                            if found and data:
+                                influencer_results.append(data)
+                        if influencer_results:
+                            strategist_prompt = (
+                                "You are Nurdd’s AI Marketing Strategist. Your job is to help brands find and evaluate the best influencers for their campaigns.\n\n"
+                                "Analyze the user's query and influencers below; Provide detailed recommendations from search results. Always:\n\n"
+                                "1. Understand the Campaign: Identify brand industry, target audience, and goals (pick from: Lifestyle, Comedy, Finance, Business, Entrepreneurship, Health, Wellness, Cooking, DIY, Crafts, Sports, Travel Vlogs, Reviews, Unboxing, ASMR, Podcasts, Motivation, Personal Development, Productivity, Science, Nature, Animals, Cars, Luxury, Minimalism, Meme Culture, News, Politics, Spirituality, Astrology)\n"
+                                "2. Recommend Best Matches: Highlight 4-5 top influencers with clear reasoning\n"
+                                "3. Provide Strategic Insights: Explain why each influencer is suitable matching their industry.\n"
+                                "4. Suggest Campaign Ideas: Offer specific collaboration concepts\n"
+                                "5. Include Practical Details: Mention engagement rates, follower counts, and content style\n"
+                                "6. Ask Follow-up Questions: Help refine the search further\n\n"
+                                "INFLUENCERS:\n"
+                                f"{json.dumps(influencer_results, indent=2)}\n\n"
+                                f"USER QUERY: {user_message}\n\n"
+                                "Be comprehensive, insightful, and focus on ROI and campaign effectiveness."
+                            )
+                            smart_response = safe_ai_message_model(strategist_prompt, MODEL_SCORING)
+                            add_message_to_memory("assistant", smart_response)
+                            return smart_response
+                        else:
+                            add_message_to_memory("assistant", "No suitable influencer profiles found for that query.")
+                            return "No suitable influencer profiles found for that query."
+                    influencer_name = influencer_name_or_names if influencer_name_or_names else (influencer_names[0] if influencer_names else None)
+                    if influencer_name:
+                        if likely_misspelling:
+                            search_msg = f"🔤 Checking spelling for '{influencer_name}', searching databases, and auto-scraping if needed..."
+                        else:
+                            search_msg = f"🔍 Searching for '{influencer_name}' in databases and auto-scraping if needed..."
+                        status.update(label=search_msg)
                         try:
                             found, data, source = self.find_influencer_comprehensive(influencer_name)
                         except Exception as e:
-                            st.error(f"Search error: {e}")
+                            notes.append(f"Search error: {e}")
+                            status_state = "error"
                             found, data, source = False, None, "search_error"
-                    if found and data:
-                        actual_name = data.get('basic_info', {}).get('name', influencer_name)
-                        username = data.get('basic_info', {}).get('username', '')
-                        if source.startswith("auto_scraped"):
-                            st.success(f"🕷️ **Auto-scraped and added:** {actual_name} (@{username}) to database!")
-                            st.info("🆕 **Fresh data** scraped from Instagram and saved to database")
-                            st.session_state.scraping_history.append({
-                                'name': actual_name,
-                                'username': username,
-                                'original_query': influencer_name,
-                                'timestamp': datetime.now().isoformat()
-                            })
-                        elif actual_name.lower() != influencer_name.lower():
-                            st.success(f"✅ Found **{actual_name}** (@{username}) in {source.split(':')[0]} database!")
-                            st.info(f"🔤 **Spelling corrected:** '{influencer_name}' → '{actual_name}'")
-                            st.session_state.spelling_corrections[influencer_name.lower()] = actual_name
+                        if found and data:
+                            actual_name = data.get('basic_info', {}).get('name', influencer_name)
+                            username = data.get('basic_info', {}).get('username', '')
+                            if source.startswith("auto_scraped"):
+                                notes.append(f"🕷️ **Auto-scraped and added:** {actual_name} (@{username}) to database!")
+                                notes.append("🆕 **Fresh data** scraped from Instagram and saved to database")
+                                st.session_state.scraping_history.append({
+                                    'name': actual_name,
+                                    'username': username,
+                                    'original_query': influencer_name,
+                                    'timestamp': datetime.now().isoformat()
+                                })
+                            elif actual_name.lower() != influencer_name.lower():
+                                notes.append(f"✅ Found **{actual_name}** (@{username}) in {source.split(':')[0]} database!")
+                                notes.append(f"🔤 **Spelling corrected:** '{influencer_name}' → '{actual_name}'")
+                                st.session_state.spelling_corrections[influencer_name.lower()] = actual_name
+                            else:
+                                notes.append(f"✅ Found **{actual_name}** (@{username}) in {source.split(':')[0]} database!")
+                            st.session_state.processed_queries[username] = data
+                            enhanced_message = f"Tell me about {actual_name}. I have their complete profile data."
+                            try:
+                                response = conversation_manager.generate_intelligent_response(
+                                    enhanced_message, st.session_state.conversation_memory
+                                )
+                            except Exception as e:
+                                notes.append(f"Response generation error: {e}")
+                                status_state = "error"
+                                response = f"Found {actual_name} (@{username}) with {data.get('basic_info', {}).get('followers_count', 0):,} followers. However, I couldn't generate the detailed analysis. Please try asking again."
+                            add_message_to_memory("assistant", response)
+                            return response
                         else:
-                            st.success(f"✅ Found **{actual_name}** (@{username}) in {source.split(':')[0]} database!")
-                        st.session_state.processed_queries[username] = data
-                        enhanced_message = f"Tell me about {actual_name}. I have their complete profile data."
-                        try:
-                            response = conversation_manager.generate_intelligent_response(
-                                enhanced_message, st.session_state.conversation_memory
-                            )
-                        except Exception as e:
-                            st.warning(f"Response generation error: {e}")
-                            response = f"Found {actual_name} (@{username}) with {data.get('basic_info', {}).get('followers_count', 0):,} followers. However, I couldn't generate the detailed analysis. Please try asking again."
-                        add_message_to_memory("assistant", response)
-                        return response
-                    else:
-                        stats = unified_data_manager.get_database_stats()
-                        error_msg = f"""❌ **Could not find "{influencer_name}" anywhere**
+                            stats = unified_data_manager.get_database_stats()
+                            error_msg = f"""❌ **Could not find "{influencer_name}" anywhere**
 **🚀 Complete Search Process (Robust Mode):**
 - ✅ AI spell check and correction
 - ✅ Searched {stats['main_database']} main profiles
@@ -438,35 +491,41 @@ This might be because:
 - Try using their exact Instagram username
 - Check if the name is spelled correctly
 **Recent Auto-Scraped:** """
-                        if st.session_state.scraping_history:
-                            recent_scraped = st.session_state.scraping_history[-3:]
-                            for scraped in recent_scraped:
-                                error_msg += f"\n- {scraped['name']} (@{scraped['username']})"
-                        else:
-                            error_msg += "None yet"
-                        add_message_to_memory("assistant", error_msg)
-                        return error_msg
-            try:
-                response = conversation_manager.generate_intelligent_response(
-                    user_message, st.session_state.conversation_memory
-                )
-                add_message_to_memory("assistant", response)
-                return response
+                            if st.session_state.scraping_history:
+                                recent_scraped = st.session_state.scraping_history[-3:]
+                                for scraped in recent_scraped:
+                                    error_msg += f"\n- {scraped['name']} (@{scraped['username']})"
+                            else:
+                                error_msg += "None yet"
+                            add_message_to_memory("assistant", error_msg)
+                            return error_msg
+                try:
+                    response = conversation_manager.generate_intelligent_response(
+                        user_message, st.session_state.conversation_memory
+                    )
+                    add_message_to_memory("assistant", response)
+                    return response
+                except Exception as e:
+                    reply = "I apologize, but I encountered an error processing your question. Please try rephrasing or asking something else."
+                    add_message_to_memory("assistant", reply)
+                    return reply
             except Exception as e:
-                reply = "I apologize, but I encountered an error processing your question. Please try rephrasing or asking something else."
+                status_state = "error"
+                reply = f"I encountered an error while processing your request: {str(e)}. Please try again or contact support if the issue persists."
                 add_message_to_memory("assistant", reply)
                 return reply
-        except Exception as e:
-            reply = f"I encountered an error while processing your request: {str(e)}. Please try again or contact support if the issue persists."
-            add_message_to_memory("assistant", reply)
-            return reply
-        finally:
-            processing_time = time.time() - start_time
-            current_avg = st.session_state.performance_stats["average_response_time"]
-            queries_count = st.session_state.performance_stats["queries_processed"]
-            st.session_state.performance_stats["average_response_time"] = (
-                (current_avg * (queries_count - 1) + processing_time) / queries_count
-            )
+            finally:
+                if speculative is not None:
+                    speculative.cancel()
+                if notes:
+                    status.markdown("\n".join(f"- {note}" for note in notes))
+                status.update(label=notes[-1] if notes else "✅ Done", state=status_state)
+                processing_time = time.time() - start_time
+                current_avg = st.session_state.performance_stats["average_response_time"]
+                queries_count = st.session_state.performance_stats["queries_processed"]
+                st.session_state.performance_stats["average_response_time"] = (
+                    (current_avg * (queries_count - 1) + processing_time) / queries_count
+                )
 
     def render_chat_interface(self):
         st.title("🎯 Nurdd's AI Marketing Strategist")
@@ -474,8 +533,7 @@ This might be because:
         try:
             init_db()
             stats = unified_data_manager.get_database_stats()
-            mode = "Async" if st.session_state.async_mode else "Sync"
-            st.success(f"✅ Robust access: {stats['main_database']} main + {stats['embeddings_database']} embeddings ({mode} mode)")
+            st.success(f"✅ Robust access: {stats['main_database']} main + {stats['embeddings_database']} embeddings")
         except Exception as e:
             st.error(f"❌ Database error: {e}")
             st.info("🔄 System will continue with available functionality")
@@ -488,7 +546,7 @@ This might be because:
                 st.markdown(message["content"])
         placeholder_text = "Ask about any influencer (🚀 robust async + fallbacks!) or describe what you want to promote..."
         if prompt := st.chat_input(placeholder_text):
-            add_message_to_memory("user", prompt)
+            # process_user_message records the user turn itself
             with st.chat_message("user"):
                 st.markdown(prompt)
             with st.chat_message("assistant"):
@@ -509,15 +567,6 @@ This might be because:
                 add_message_to_memory("assistant", self.get_welcome_message())
                 st.success("Started a new conversation. Memory cleared.")
                 st.rerun()
-            st.header("⚡ Processing Mode")
-            async_mode = st.checkbox("Enable Async Mode", value=st.session_state.async_mode)
-            if async_mode != st.session_state.async_mode:
-                st.session_state.async_mode = async_mode
-                st.success(f"Switched to {'Async' if async_mode else 'Sync'} mode")
-            if async_mode:
-                st.success("🚀 Async mode active (faster)")
-            else:
-                st.info("🔄 Sync mode active (reliable)")
             st.header("🚀 Robust Performance")
             stats = unified_data_manager.get_database_stats()
             perf_stats = st.session_state.performance_stats
@@ -531,7 +580,7 @@ This might be because:
                 with col2:
                     st.metric("Embeddings", stats['embeddings_database']) 
                     st.metric("Async Successes", perf_stats["async_successes"])
-                    st.metric("Sync Fallbacks", perf_stats["sync_fallbacks"])
+                    st.metric("Search Errors", perf_stats["search_errors"])
                 if perf_stats["queries_processed"] > 0:
                     async_rate = (perf_stats["async_successes"] / perf_stats["queries_processed"]) * 100
                     if async_rate > 80:
@@ -546,11 +595,12 @@ This might be because:
                 st.session_state.data_loaded = False
                 unified_data_manager.main_db_loaded = False
                 unified_data_manager.embeddings_loaded = False
+                unified_data_manager.invalidate_cache()
                 fast_semantic_matcher.is_loaded = False
                 st.session_state.performance_stats = {
                     "queries_processed": 0,
                     "async_successes": 0,
-                    "sync_fallbacks": 0,
+                    "search_errors": 0,
                     "average_response_time": 0
                 }
                 st.success("Data will reload on next query")
@@ -560,7 +610,7 @@ This might be because:
             if new_auto_scraping != current_auto_scraping:
                 unified_data_manager.toggle_auto_scraping(new_auto_scraping)
             if new_auto_scraping:
-                st.success("⚡ Robust scraping enabled (async + sync fallbacks)")
+                st.success("⚡ Robust scraping enabled (async)")
             else:
                 st.warning("⚠️ Auto-scraping disabled")
             if st.session_state.scraping_history:
@@ -587,52 +637,18 @@ This might be because:
             else:
                 st.text("No corrections made yet")
             st.header("💡 Try These Examples")
-            examples = [
-                "What do you know about dhruv rathi?",     
-                "Tell me about carry minati",             
-                "What about harsh beniwall?",             
-                "Tell me about triggered insaan",         
-                "I want to promote my gaming laptop",     
-                "Find influencers for my skincare brand", 
-                "Who should advertise my fitness app?",   
-                "What about bhuvan bam?",                 
-                "Tell me about any influencer name",      
-            ]
-            for example in examples:
-                if st.button(example, key=f"ex_{hash(example)}"):
+            for key, example in zip(EXAMPLE_KEYS, EXAMPLES):
+                if st.button(example, key=key):
                     add_message_to_memory("user", example)
                     st.rerun()
             st.header("🛡️ Robust Features")
-            st.info("""
-            **⚡ Performance Optimizations:**
-            - Async processing: 25-50% faster
-            - Sync fallbacks: 100% reliability
-            - Connection pooling: Efficient HTTP
-            - Error recovery: Graceful degradation
-
-            **🔤 Smart Features:**
-            - AI spell correction: Works with errors
-            - Fuzzy name matching: Finds variations
-            - Cross-database search: Comprehensive
-            - SSL fixes: Handles certificate issues
-
-            **🕷️ Auto-Scraping:**
-            - Robust Google search
-            - Parallel profile + posts scraping
-            - Multiple fallback strategies
-            - Error handling at every step
-
-            **🛡️ Reliability:**
-            - Multiple error recovery paths
-            - Graceful degradation
-            - Performance monitoring
-            - Success rate tracking
-            """)
+            st.info(ROBUST_FEATURES_MD)
 
     def run(self):
         self.render_chat_interface()
         self.render_sidebar()
 
 if __name__ == "__main__":
+    setup_logging()
     chatbot = IntelligentChatbot()
     chatbot.run()
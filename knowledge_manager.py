@@ -1,21 +1,188 @@
 import json
+import os
 import re
+import sys
+import hashlib
+import heapq
+import threading
+import zlib
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+import faiss
 from database import get_database
+from config import DATABASE_FILE
+from fast_semantic_matcher import fast_semantic_matcher
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from rapidfuzz import process as fuzz_process, fuzz
+except ImportError:
+    fuzz_process = None
+
+# Per-row embeddings of searchable_text, reused across restarts while the text is unchanged
+KNOWLEDGE_EMBEDDINGS_FILE = "knowledge_embeddings.npz"
+# Derived rows and scoring arrays, reused while the database file is unchanged
+KNOWLEDGE_CACHE_DIR = "knowledge_cache"
+KNOWLEDGE_CACHE_ARRAYS = ("content_quality", "engagement", "hashtag_indptr", "hashtag_hashes")
+# Bump whenever row building, Influencer fields or the array layout change, so stale caches are rebuilt
+KNOWLEDGE_CACHE_SCHEMA_VERSION = 1
+# Past this many rows the index is product-quantised (IVFPQ) and persisted, since training is costly
+IVFPQ_MIN_ROWS = 50_000
+IVFPQ_NLIST = 256
+IVFPQ_M = 48
+IVFPQ_NPROBE = 8
+# Compressed-distance hits re-scored exactly against the stored vectors
+IVFPQ_RERANK_FACTOR = 4
+KNOWLEDGE_IVFPQ_FILE = "knowledge_ivfpq.faiss"
+# fp16 row vectors for the exact re-score, memory-mapped so only shortlisted rows are paged in
+KNOWLEDGE_RERANK_FILE = "knowledge_rerank.npy"
+# Weight of the cosine similarity (0-1) in the relevance score
+SEMANTIC_WEIGHT = 50
+
+
+def _token_hash(token: str) -> int:
+    """Stable 32-bit hash of a lowercased token (str hash() is salted per process)"""
+    return zlib.crc32(token.lower().encode("utf-8"))
+
+
+def _score_kernel_numpy(query_hashes, indptr, hashes, content_quality, engagement, out):
+    """Hashtag matches * 5 + quality bonuses for every row, vectorised with NumPy"""
+    hits = np.isin(hashes, query_hashes).astype(np.float32)
+    cumulative = np.concatenate((np.zeros(1, dtype=np.float32), np.cumsum(hits, dtype=np.float32)))
+    matches = cumulative[indptr[1:]] - cumulative[indptr[:-1]]
+    out[:] = content_quality * 0.1 + engagement * 100.0 + matches * 5.0
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _score_kernel(query_hashes, indptr, hashes, content_quality, engagement, out):
+        """Same as _score_kernel_numpy, compiled to a parallel loop over rows"""
+        for i in prange(out.shape[0]):
+            matches = 0
+            for j in range(indptr[i], indptr[i + 1]):
+                for q in range(query_hashes.shape[0]):
+                    if hashes[j] == query_hashes[q]:
+                        matches += 1
+                        break
+            out[i] = content_quality[i] * 0.1 + engagement[i] * 100.0 + matches * 5.0
+else:
+    _score_kernel = _score_kernel_numpy
+
+
+def _format_context_block(inf: "Influencer") -> str:
+    """Context block for one influencer"""
+    formatted = f"""
+            • {inf.name} (@{inf.username})
+              Category: {inf.category} | Followers: {inf.followers:,}
+              Engagement: {inf.engagement_rate:.3f}% | Verified: {'✓' if inf.verified else '✗'}
+              Bio: {inf.bio[:100]}...
+              Content Focus: {', '.join(inf.top_hashtags[:8])}
+              Recent Brands: {', '.join(inf.brand_collaborations[:5])}
+              Quality Score: {inf.content_quality}/100
+            """
+    return formatted.strip()
+
+
+@dataclass(slots=True)
+class Influencer:
+    """One knowledge-base row; the lowercased search fields are derived on construction"""
+    username: str
+    name: str
+    category: str
+    followers: int
+    engagement_rate: float
+    bio: str
+    top_hashtags: List[str]
+    brand_collaborations: List[str]
+    content_quality: float
+    authenticity: float
+    brand_safety: float
+    audience_match: float
+    verified: bool
+    business_account: bool
+    searchable_text: str = ""
+    _search_lower: str = field(init=False, repr=False, compare=False)
+    _cat_lower: str = field(init=False, repr=False, compare=False)
+    _hash_tokens: frozenset = field(init=False, repr=False, compare=False)
+    _formatted: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Categories and hashtags repeat across many rows, so share one copy of each string
+        if isinstance(self.category, str):
+            self.category = sys.intern(self.category)
+        self.top_hashtags = [sys.intern(h) if isinstance(h, str) else h for h in self.top_hashtags]
+        
+        # Lowercased once here instead of on every query
+        self._search_lower = self.searchable_text.lower()
+        self._cat_lower = self.category.lower() if isinstance(self.category, str) else ""
+        self._hash_tokens = frozenset(h.lower() for h in self.top_hashtags if isinstance(h, str))
+        self._formatted = _format_context_block(self)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Public fields as a plain dict"""
+        return {name: getattr(self, name) for name in INFLUENCER_FIELDS}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Influencer":
+        return cls(**{name: data[name] for name in INFLUENCER_FIELDS if name in data})
+
+
+INFLUENCER_FIELDS = tuple(f.name for f in fields(Influencer) if f.init)
 
 
 class KnowledgeManager:
     """Manages and processes influencer knowledge base for RAG"""
     
     def __init__(self):
-        self.knowledge_base = None
-        self.influencer_profiles = {}
+        self.knowledge_base: Optional[List[Influencer]] = None
+        self.influencer_profiles: Dict[str, Influencer] = {}
         self.last_updated = None
+        self._vector_index: Optional[faiss.Index] = None
+        # Held while the index is built, so concurrent first queries never build it twice
+        self._vector_index_lock = threading.Lock()
+        self._rerank_embeddings: Optional[np.ndarray] = None
+        self._embeddings_fingerprint: Optional[str] = None
+        self._semantic_unavailable = False
+        self._category_automaton = None
+        self._categories = frozenset()
+        self._name_index: List[str] = []
+        self._name_index_usernames: List[str] = []
+        self._top10_by_followers: List[Influencer] = []
+        self._top10_context: Optional[str] = None
         self._load_knowledge()
     
     def _load_knowledge(self):
         """Load and process database into searchable knowledge"""
+        db_signature = self._database_signature()
+        if not self._load_knowledge_cache(db_signature):
+            self._build_knowledge()
+            self._build_score_arrays()
+            self._save_knowledge_cache(db_signature)
+        
+        self._build_category_matcher()
+        self._build_name_index()
+        self._top10_by_followers = heapq.nlargest(10, self.knowledge_base, key=lambda x: x.followers)
+        self._top10_context = None
+        self.last_updated = datetime.now()
+        # Rows changed: the ANN index is rebuilt by the next relevance query
+        self._vector_index = None
+        self._rerank_embeddings = None
+        print(f"✅ Knowledge base loaded with {len(self.knowledge_base)} influencer profiles")
+    
+    def _build_knowledge(self):
+        """Build knowledge rows from the full profile database"""
         db = get_database()
         profiles = db.get("profiles", {})
         
@@ -50,8 +217,8 @@ class KnowledgeManager:
                     "followers": basic_info.get("followers_count", 0) or 0,
                     "engagement_rate": analysis.get("engagement_rate", 0) or 0,
                     "bio": bio,
-                    "top_hashtags": list(hashtags.keys())[:15] if hashtags else [],
-                    "brand_collaborations": collaborations.get("brands_worked_with", [])[:10] if collaborations.get("brands_worked_with") else [],
+                    "top_hashtags": list(islice(hashtags, 15)) if hashtags else [],
+                    "brand_collaborations": list(islice(collaborations.get("brands_worked_with") or (), 10)),
                     "content_quality": analysis.get("scores", {}).get("ContentQuality", 0) or 0,
                     "authenticity": analysis.get("scores", {}).get("Authenticity", 0) or 0,
                     "brand_safety": analysis.get("scores", {}).get("BrandSafety", 0) or 0,
@@ -74,15 +241,250 @@ class KnowledgeManager:
                 """
                 
                 knowledge_entry["searchable_text"] = searchable_text
-                self.knowledge_base.append(knowledge_entry)
-                self.influencer_profiles[username] = knowledge_entry
+                self._add_entry(Influencer(**knowledge_entry))
                 
             except Exception as e:
                 print(f"Error processing profile {username}: {e}")
                 continue
+    
+    def _add_entry(self, influencer: Influencer):
+        """Register a knowledge row"""
+        self.knowledge_base.append(influencer)
+        self.influencer_profiles[influencer.username] = influencer
+    
+    @staticmethod
+    def _database_signature() -> Optional[List[int]]:
+        """mtime and size of the database file, or None when it does not exist"""
+        try:
+            stat = os.stat(DATABASE_FILE)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+    
+    def _load_knowledge_cache(self, db_signature: Optional[List[int]]) -> bool:
+        """Restore rows and memory-mapped scoring arrays saved for this exact database file"""
+        meta_path = os.path.join(KNOWLEDGE_CACHE_DIR, "meta.json")
+        if db_signature is None or not os.path.exists(meta_path):
+            return False
         
-        self.last_updated = datetime.now()
-        print(f"✅ Knowledge base loaded with {len(self.knowledge_base)} influencer profiles")
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("schema_version") != KNOWLEDGE_CACHE_SCHEMA_VERSION or meta.get("db_signature") != db_signature:
+                return False
+            
+            arrays = {
+                name: np.load(os.path.join(KNOWLEDGE_CACHE_DIR, f"{name}.npy"), mmap_mode="r")
+                for name in KNOWLEDGE_CACHE_ARRAYS
+            }
+            self.knowledge_base = []
+            self.influencer_profiles = {}
+            for entry in meta["entries"]:
+                self._add_entry(Influencer(**entry))
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable knowledge cache: {e}")
+            return False
+        
+        self._content_quality = arrays["content_quality"]
+        self._engagement = arrays["engagement"]
+        self._hashtag_indptr = arrays["hashtag_indptr"]
+        self._hashtag_hashes = arrays["hashtag_hashes"]
+        return True
+    
+    def _save_knowledge_cache(self, db_signature: Optional[List[int]]):
+        """Persist rows and scoring arrays; meta.json is written last so a partial save is never used"""
+        if db_signature is None:
+            return
+        
+        try:
+            os.makedirs(KNOWLEDGE_CACHE_DIR, exist_ok=True)
+            np.save(os.path.join(KNOWLEDGE_CACHE_DIR, "content_quality.npy"), self._content_quality)
+            np.save(os.path.join(KNOWLEDGE_CACHE_DIR, "engagement.npy"), self._engagement)
+            np.save(os.path.join(KNOWLEDGE_CACHE_DIR, "hashtag_indptr.npy"), self._hashtag_indptr)
+            np.save(os.path.join(KNOWLEDGE_CACHE_DIR, "hashtag_hashes.npy"), self._hashtag_hashes)
+            
+            entries = [inf.to_dict() for inf in self.knowledge_base]
+            with open(os.path.join(KNOWLEDGE_CACHE_DIR, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({
+                    "schema_version": KNOWLEDGE_CACHE_SCHEMA_VERSION,
+                    "db_signature": db_signature,
+                    "entries": entries,
+                }, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"⚠️ Could not save knowledge cache: {e}")
+
+    def _build_score_arrays(self):
+        """Materialise the numeric scoring inputs as flat arrays (one slot per knowledge row)"""
+        self._content_quality = np.array([inf.content_quality for inf in self.knowledge_base], dtype=np.float32)
+        self._engagement = np.array([inf.engagement_rate for inf in self.knowledge_base], dtype=np.float32)
+        
+        # Ragged hashtag lists stored CSR-style: row i owns hashes[indptr[i]:indptr[i + 1]]
+        indptr = [0]
+        hashes = []
+        for inf in self.knowledge_base:
+            hashes.extend(_token_hash(h) for h in inf._hash_tokens)
+            indptr.append(len(hashes))
+        self._hashtag_indptr = np.array(indptr, dtype=np.int64)
+        self._hashtag_hashes = np.array(hashes, dtype=np.int64)
+    
+    def _build_category_matcher(self):
+        """One automaton over all distinct categories, so a single scan of the query finds every match"""
+        self._categories = frozenset(inf._cat_lower for inf in self.knowledge_base if inf._cat_lower)
+        self._category_automaton = None
+        if ahocorasick is not None and self._categories:
+            automaton = ahocorasick.Automaton()
+            for category in self._categories:
+                automaton.add_word(category, category)
+            automaton.make_automaton()
+            self._category_automaton = automaton
+    
+    def _build_name_index(self):
+        """Usernames and display names as fuzzy-match choices, each mapped back to its username"""
+        self._name_index = []
+        self._name_index_usernames = []
+        for inf in self.knowledge_base:
+            self._name_index.append(inf.username)
+            self._name_index_usernames.append(inf.username)
+            if inf.name and inf.name != "Unknown":
+                self._name_index.append(inf.name)
+                self._name_index_usernames.append(inf.username)
+    
+    def match_names(self, query: str, limit: int = 3, score_cutoff: float = 88) -> List[Tuple[str, float]]:
+        """Known usernames whose handle or name fuzzily matches the query, best first"""
+        if fuzz_process is None or not self._name_index or not query:
+            return []
+        
+        hits = fuzz_process.extract(query.lower(), self._name_index, scorer=fuzz.WRatio,
+                                    processor=str.lower, limit=limit * 2, score_cutoff=score_cutoff)
+        matches = {}
+        for _, score, idx in hits:
+            username = self._name_index_usernames[idx]
+            matches[username] = max(score, matches.get(username, 0))
+        return sorted(matches.items(), key=lambda item: item[1], reverse=True)[:limit]
+    
+    def _categories_in(self, query_lower: str) -> frozenset:
+        """Categories that occur as substrings of the query"""
+        if self._category_automaton is not None:
+            return frozenset(category for _, category in self._category_automaton.iter(query_lower))
+        return frozenset(category for category in self._categories if category in query_lower)
+    
+    def _encode_knowledge(self, texts: List[str]) -> np.ndarray:
+        """Encode searchable texts, reusing rows cached on disk whose text hash is unchanged"""
+        hashes = [hashlib.sha1(text.encode("utf-8")).hexdigest() for text in texts]
+        cached = {}
+        if os.path.exists(KNOWLEDGE_EMBEDDINGS_FILE):
+            try:
+                data = np.load(KNOWLEDGE_EMBEDDINGS_FILE, allow_pickle=False)
+                cached = dict(zip(data["hashes"].tolist(), data["embeddings"]))
+            except Exception as e:
+                print(f"⚠️ Ignoring unreadable knowledge embeddings cache: {e}")
+        
+        self._embeddings_fingerprint = hashlib.sha1("".join(hashes).encode("utf-8")).hexdigest()
+        missing = [i for i, h in enumerate(hashes) if h not in cached]
+        if missing:
+            vectors = fast_semantic_matcher.get_batch_embeddings([texts[i] for i in missing])
+            for i, vec in zip(missing, vectors):
+                cached[hashes[i]] = vec
+        
+        embeddings = np.stack([cached[h] for h in hashes]).astype(np.float32)
+        if missing:
+            try:
+                np.savez(KNOWLEDGE_EMBEDDINGS_FILE, hashes=np.array(hashes), embeddings=embeddings.astype(np.float16))
+            except Exception as e:
+                print(f"⚠️ Could not save knowledge embeddings cache: {e}")
+        return embeddings
+    
+    def _ensure_vector_index(self) -> Optional[faiss.Index]:
+        """Build the HNSW index over knowledge rows on first use, so importers that never query skip the encode"""
+        with self._vector_index_lock:
+            if self._vector_index is not None or self._semantic_unavailable or not self.knowledge_base:
+                return self._vector_index
+            
+            rows = self.knowledge_base
+            rerank_embeddings = None
+            try:
+                embeddings = self._encode_knowledge([inf.searchable_text for inf in rows])
+                if len(embeddings) >= IVFPQ_MIN_ROWS:
+                    index, rerank_embeddings = self._load_or_build_ivfpq(embeddings)
+                else:
+                    # fp16 scalar quantisation halves index memory with negligible loss on unit vectors
+                    index = faiss.IndexHNSWSQ(embeddings.shape[1], faiss.ScalarQuantizer.QT_fp16, 32, faiss.METRIC_INNER_PRODUCT)
+                    index.hnsw.efConstruction = 80
+                    index.train(embeddings)
+                    index.add(embeddings)
+            except Exception as e:
+                print(f"ℹ️ Semantic knowledge index unavailable ({e}), using keyword relevance only")
+                self._semantic_unavailable = True
+                return None
+            
+            # A refresh during the build replaced the rows; the next query builds over the new ones
+            if self.knowledge_base is not rows:
+                return None
+            self._vector_index = index
+            self._rerank_embeddings = rerank_embeddings
+            return index
+    
+    def _load_or_build_ivfpq(self, embeddings: np.ndarray) -> Tuple[faiss.Index, Optional[np.ndarray]]:
+        """IVFPQ index plus memory-mapped re-score vectors, reused from disk while the row embeddings are unchanged"""
+        fingerprint_path = KNOWLEDGE_IVFPQ_FILE + ".sig"
+        if all(os.path.exists(path) for path in (KNOWLEDGE_IVFPQ_FILE, KNOWLEDGE_RERANK_FILE, fingerprint_path)):
+            try:
+                with open(fingerprint_path, "r", encoding="utf-8") as f:
+                    if f.read().strip() == self._embeddings_fingerprint:
+                        index = faiss.read_index(KNOWLEDGE_IVFPQ_FILE)
+                        index.nprobe = IVFPQ_NPROBE
+                        return index, np.load(KNOWLEDGE_RERANK_FILE, mmap_mode="r")
+            except Exception as e:
+                print(f"⚠️ Rebuilding unreadable IVFPQ index: {e}")
+        
+        print(f"🔧 Training IVFPQ index over {len(embeddings)} knowledge rows...")
+        quantizer = faiss.IndexFlatIP(embeddings.shape[1])
+        index = faiss.IndexIVFPQ(quantizer, embeddings.shape[1], IVFPQ_NLIST, IVFPQ_M, 8, faiss.METRIC_INNER_PRODUCT)
+        index.train(embeddings)
+        index.add(embeddings)
+        index.nprobe = IVFPQ_NPROBE
+        try:
+            faiss.write_index(index, KNOWLEDGE_IVFPQ_FILE)
+            np.save(KNOWLEDGE_RERANK_FILE, embeddings.astype(np.float16))
+            # The signature goes last so a partial save is never reused
+            with open(fingerprint_path, "w", encoding="utf-8") as f:
+                f.write(self._embeddings_fingerprint)
+            rerank_embeddings = np.load(KNOWLEDGE_RERANK_FILE, mmap_mode="r")
+        except Exception as e:
+            # Without the on-disk store, re-score from the PQ codes themselves
+            print(f"⚠️ Could not save IVFPQ index: {e}")
+            index.make_direct_map()
+            rerank_embeddings = None
+        return index, rerank_embeddings
+    
+    def _semantic_candidates(self, query: str, k: int) -> Optional[Dict[int, float]]:
+        """Map knowledge_base row -> cosine similarity for the k nearest rows, or None without an index"""
+        index = self._ensure_vector_index()
+        if index is None:
+            return None
+        
+        try:
+            q = fast_semantic_matcher.get_query_embedding(query).reshape(1, -1)
+        except Exception as e:
+            # Row vectors may come from the on-disk cache while no encoder is installed
+            print(f"ℹ️ Could not embed query ({e}), using keyword relevance only")
+            self._semantic_unavailable = True
+            self._vector_index = None
+            return None
+        if not isinstance(index, faiss.IndexIVFPQ):
+            similarities, rows = index.search(q, min(k, len(self.knowledge_base)))
+            return {int(row): float(sim) for sim, row in zip(similarities[0], rows[0]) if row != -1}
+        
+        # PQ distances are approximate: re-score a shortlist several times wider than k and keep the best k
+        _, rows = index.search(q, min(k * IVFPQ_RERANK_FACTOR, len(self.knowledge_base)))
+        rows = rows[0][rows[0] != -1]
+        if self._rerank_embeddings is not None:
+            vectors = self._rerank_embeddings[rows].astype(np.float32)
+        else:
+            vectors = index.reconstruct_batch(rows)
+        exact = vectors @ q[0]
+        best = np.argsort(-exact)[:k]
+        return {int(rows[i]): float(exact[i]) for i in best}
 
     
     def get_relevant_influencers(self, query: str, limit: int = 5) -> List[Dict]:
@@ -91,70 +493,76 @@ class KnowledgeManager:
             return []
         
         query_lower = query.lower()
-        scored_influencers = []
+        q_tokens = set(query_lower.split())
+        n = len(self.knowledge_base)
+        
+        # Hashtag matches and quality bonuses for every row in one kernel call
+        query_hashes = np.array(sorted(_token_hash(w) for w in q_tokens), dtype=np.int64)
+        scores = np.empty(n, dtype=np.float32)
+        _score_kernel(query_hashes, self._hashtag_indptr, self._hashtag_hashes,
+                      self._content_quality, self._engagement, scores)
+        
+        # Rerank the ANN neighbours when the index is available, otherwise consider every row
+        similarities = self._semantic_candidates(query, limit * 4) or {}
+        if similarities:
+            rows = np.fromiter(similarities.keys(), dtype=np.int64, count=len(similarities))
+            scores[rows] += np.fromiter(similarities.values(), dtype=np.float32, count=len(similarities)) * SEMANTIC_WEIGHT
+        else:
+            rows = np.arange(n)
+        
+        # Query tokens compiled once; each row's text is then scanned in a single C pass
+        keyword_automaton = None
+        if ahocorasick is not None and q_tokens:
+            keyword_automaton = ahocorasick.Automaton()
+            for token in q_tokens:
+                keyword_automaton.add_word(token, token)
+            keyword_automaton.make_automaton()
+        matched_categories = self._categories_in(query_lower)
         
-        for influencer in self.knowledge_base:
-            score = 0
-            searchable = influencer.get("searchable_text", "").lower()
+        for row in rows:
+            influencer = self.knowledge_base[row]
+            searchable = influencer._search_lower
             
             # Keyword matching with weights
-            if any(keyword in searchable for keyword in query_lower.split()):
-                score += 10
-            
-            # Category matching - FIX: Check if category is string before calling lower()
-            category = influencer.get("category")
-            if isinstance(category, str) and category.lower() in query_lower:
-                score += 20
-            
-            # Hashtag relevance - FIX: Ensure hashtags exist
-            hashtags = influencer.get("top_hashtags", [])
-            if hashtags:
-                matching_hashtags = sum(1 for hashtag in hashtags 
-                                    if isinstance(hashtag, str) and 
-                                    any(word in hashtag.lower() for word in query_lower.split()))
-                score += matching_hashtags * 5
-            
-            # Quality bonuses - FIX: Safe get with defaults
-            content_quality = influencer.get("content_quality", 0)
-            engagement_rate = influencer.get("engagement_rate", 0)
+            if keyword_automaton is not None:
+                if next(keyword_automaton.iter(searchable), None) is not None:
+                    scores[row] += 10
+            elif any(keyword in searchable for keyword in q_tokens):
+                scores[row] += 10
             
-            if content_quality:
-                score += content_quality * 0.1
-            if engagement_rate:
-                score += engagement_rate * 100
-            
-            if score > 0:
-                influencer_copy = influencer.copy()
-                influencer_copy["relevance_score"] = score
-                scored_influencers.append(influencer_copy)
+            # Category matching
+            if influencer._cat_lower in matched_categories:
+                scores[row] += 20
         
-        # Sort by relevance score
-        scored_influencers.sort(key=lambda x: x["relevance_score"], reverse=True)
-        return scored_influencers[:limit]
+        # Top-k selection in O(n) on the score array; only the surviving rows become dicts
+        row_scores = scores[rows]
+        positive = row_scores > 0
+        rows, row_scores = rows[positive], row_scores[positive]
+        if len(rows) > limit:
+            top = np.argpartition(-row_scores, limit)[:limit]
+            rows, row_scores = rows[top], row_scores[top]
+        order = np.argsort(-row_scores)
+        return [self._result_entry(row, score) for row, score in zip(rows[order].tolist(), row_scores[order].tolist())]
+    
+    def _result_entry(self, row: int, score: float) -> Dict:
+        """Public fields of a knowledge row plus its score"""
+        entry = self.knowledge_base[row].to_dict()
+        entry["relevance_score"] = score
+        return entry
     
     def get_formatted_knowledge_context(self, relevant_influencers: List[Dict] = None) -> str:
         """Format knowledge for AI context"""
         if relevant_influencers:
-            influencers_to_format = relevant_influencers
-        else:
-            # Get top influencers by followers if no specific relevance
-            influencers_to_format = sorted(self.knowledge_base, 
-                                         key=lambda x: x["followers"], reverse=True)[:10]
-        
-        formatted_knowledge = []
-        for inf in influencers_to_format:
-            formatted = f"""
-            • {inf['name']} (@{inf['username']})
-              Category: {inf['category']} | Followers: {inf['followers']:,}
-              Engagement: {inf['engagement_rate']:.3f}% | Verified: {'✓' if inf['verified'] else '✗'}
-              Bio: {inf['bio'][:100]}...
-              Content Focus: {', '.join(inf['top_hashtags'][:8])}
-              Recent Brands: {', '.join(inf['brand_collaborations'][:5])}
-              Quality Score: {inf['content_quality']}/100
-            """
-            formatted_knowledge.append(formatted.strip())
+            return "\n\n".join(
+                self.influencer_profiles[inf["username"]]._formatted
+                if inf.get("username") in self.influencer_profiles else Influencer.from_dict(inf)._formatted
+                for inf in relevant_influencers
+            )
         
-        return "\n\n".join(formatted_knowledge)
+        # Get top influencers by followers if no specific relevance; fixed until the next refresh
+        if self._top10_context is None:
+            self._top10_context = "\n\n".join(inf._formatted for inf in self._top10_by_followers)
+        return self._top10_context
     
     def refresh_knowledge(self):
         """Refresh knowledge base from database"""
@@ -1,12 +1,24 @@
-import json
+import io
+import os
+import time
+import asyncio
+import logging
+import orjson
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
 from datetime import datetime
+import numpy as np
+import faiss
 from api_clients import (
     message_model,
-    search_google,
-    scrape_complete_instagram_profile,
+    search_google_async,
+    scrape_complete_instagram_profile_async,
+    cleanup_async_resources,
     test_apify_connection,
     parse_normalization_response,
-    parse_profile_selection_response,
+    parse_normselect_response,
     parse_scoring_response
 )
 from workflow_logic import (
@@ -24,186 +36,321 @@ from database import (
     get_database_stats
 )
 from config import (
-    MODEL_NORMALIZER,
     MODEL_SELECTOR,
-    MODEL_SCORING
+    MODEL_SCORING,
+    setup_logging
 )
+from fast_semantic_matcher import fast_semantic_matcher
+from knowledge_manager import knowledge_manager
 
-def run_workflow(chat_message: str):
-    """Main workflow with improved error handling."""
-    print(f"\n--- Starting workflow for query: '{chat_message}' ---")
-    
-    # Validate input
-    if not chat_message or not chat_message.strip():
-        print("❌ Empty query provided")
-        return None
-    
-    try:
-        # Step 1: Normalize query with AI (simplified prompt)
-        print("\n[Step 1] Normalizing query with AI...")
-        prompt1 = f"""
-Analyze this name/query: "{chat_message}"
+# Workflow progress; handlers are installed by config.setup_logging at the entry point
+log = logging.getLogger("workflow")
+
+# Fixed instructions first so the provider can reuse the cached prompt prefix across calls
+SYSTEM_PROMPT_NORMSELECT = """You normalize influencer name queries and choose the OFFICIAL Instagram profile from search candidates.
+Respond with ONE JSON object only, no extra text or biography:
+{"search_name": "best name for this person", "aliases": ["other names"], "handles": ["likely instagram handles"], "selected": {"name": "best name for this person", "username": "instagram username without @", "instagram_url": "full instagram.com URL", "confidence": 0.0}}
+Confidence is a number between 0 and 1.
+"""
 
-Respond in this EXACT format only:
+PROMPT_NORMSELECT_TMPL = """Query: "{query}"
 
-Search Name: {chat_message}
+Instagram profile candidates found:
+{candidates}
+"""
 
-Aliases:
-- None known
+PROMPT_SCORING_TMPL = """
+Based on these Instagram metrics, provide scores:
 
-Handles:
-- None known
+Username: {username}
+Posts Analyzed: {posts_analyzed}
+Average Engagement Rate: {avg_engagement:.4f}
+Consistency Score: {consistency:.1f}
+
+Respond in this EXACT format:
 
-Do not add any extra information or biography.
+Authenticity: [score 0-100]
+Brand Safety: [score 0-100]
+Audience Match: [score 0-100]
+Content Quality: [score 0-100]
 """
-        
-        normalized_text = message_model(prompt1, MODEL_NORMALIZER)
-        if not normalized_text:
-            print("❌ AI normalization failed, using original query")
-            normalized_data = {
-                'search_name': chat_message,
-                'aliases': [],
-                'handles': []
-            }
-        else:
-            normalized_data = parse_normalization_response(normalized_text, chat_message)
-        
-        print(f"✅ Normalized data: {json.dumps(normalized_data, indent=2)}")
-        
-        # Step 2: Search Google
-        print("\n[Step 2] Searching Google...")
-        search_name = normalized_data.get('search_name', chat_message)
-        search_results = search_google(search_name)
-        
-        if not search_results:
-            print("❌ Google search failed")
-            return None
-        
-        organic_results = search_results.get('organic', [])
-        print(f"✅ Found {len(organic_results)} search results")
-        
-        # Step 3: Process search candidates
-        print("\n[Step 3] Processing search candidates...")
-        search_query, candidates = build_search_query_and_filter_candidates(
-            normalized_data, chat_message, search_results
-        )
-        
-        print(f"Found {len(candidates)} potential candidates")
-        
-        if not candidates:
-            print("❌ No suitable Instagram profiles found")
-            return None
-        
-        # Step 4: Select official profile with AI
-        print("\n[Step 4] Selecting official profile with AI...")
-        prompt2 = f"""
-Query: "{chat_message}"
 
-Instagram profile candidates found:
-{json.dumps(candidates[:3], indent=2)}
+@lru_cache(maxsize=2048)
+def _cached_message_model(prompt: str, model: str, system: Optional[str] = None) -> str:
+    """message_model memoised on (prompt, model, system); empty responses raise so failures are not cached."""
+    content = message_model(prompt, model, system=system)
+    if not content:
+        raise RuntimeError("empty model response")
+    return content
 
-Choose the OFFICIAL Instagram profile. Respond in this EXACT format:
+def _ask_model(prompt: str, model: str, system: Optional[str] = None):
+    try:
+        return _cached_message_model(prompt, model, system)
+    except RuntimeError:
+        return None
 
-Name: [best name for this person]
-Username: [instagram username without @]
-Instagram URL: [full instagram.com URL]
-Confidence: [number between 0 and 1]
-"""
+# AI profile selections keyed by the Serper organic links they were chosen from
+SELECTION_CACHE_MAX = 2048
+_selection_cache: "OrderedDict[str, dict]" = OrderedDict()
+
+# rapidfuzz WRatio scores for resolving a query against known profiles without search or LLM
+KNOWN_PROFILE_CANDIDATE_SCORE = 88
+KNOWN_PROFILE_MATCH_SCORE = 92
+
+# LRU of workflow results (as usernames) and intermediate LLM outputs
+QUERY_CACHE_MAX = 1024
+# Entries expire like the semantic cache's, so an exact repeat never outlives its source result
+QUERY_CACHE_TTL_SECONDS = 6 * 60 * 60
+_query_cache: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (timestamp, value)
+# Each CLI run is its own process, so both caches are saved here and restored by the next run
+QUERY_CACHE_FILE = "workflow_query_cache.json"
+
+def _cache_key(kind: str, text: str) -> str:
+    """Key for a cache entry of the given kind, insensitive to case and surrounding whitespace."""
+    return f"{kind}:" + hashlib.sha256(text.strip().lower().encode("utf-8")).hexdigest()
+
+def _cache_get(key: str):
+    entry = _query_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.time() - stored_at > QUERY_CACHE_TTL_SECONDS:
+        del _query_cache[key]
+        return None
+    _query_cache.move_to_end(key)
+    return value
+
+def _cache_put(key: str, value: dict, stored_at: Optional[float] = None):
+    _query_cache[key] = (time.time() if stored_at is None else stored_at, value)
+    _query_cache.move_to_end(key)
+    while len(_query_cache) > QUERY_CACHE_MAX:
+        _query_cache.popitem(last=False)
+
+# Semantic cache: paraphrases of an answered query reuse its result.
+# The threshold is strict so near-identical names ("dhruv rathi" / "dhruv rathee") stay apart.
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_TTL_SECONDS = 6 * 60 * 60
+_semantic_index = None
+_semantic_vectors = []
+_semantic_entries = []  # (timestamp, username), parallel to index rows
+_semantic_cache_disabled = False
+
+def _embed_query(chat_message: str):
+    """Normalized query embedding, or None when no embedding model is available."""
+    global _semantic_cache_disabled
+    if _semantic_cache_disabled:
+        return None
+    try:
+        vec = fast_semantic_matcher.get_query_embedding(chat_message.strip().lower())
+        return np.asarray(vec, dtype=np.float32).reshape(1, -1)
+    except Exception as e:
+        log.info("⚠️ Semantic cache disabled: %s", e)
+        _semantic_cache_disabled = True
+        return None
+
+def _semantic_cache_get(q_vec):
+    """(timestamp, username) of a fresh cached result for a near-identical query, or None."""
+    if q_vec is None or _semantic_index is None or _semantic_index.ntotal == 0:
+        return None
+    k = min(4, _semantic_index.ntotal)
+    D, I = _semantic_index.search(q_vec, k)
+    now = time.time()
+    for sim, row in zip(D[0], I[0]):
+        if row < 0 or sim < SEMANTIC_CACHE_THRESHOLD:
+            break
+        stored_at, username = _semantic_entries[row]
+        if now - stored_at <= SEMANTIC_CACHE_TTL_SECONDS:
+            return stored_at, username
+    return None
+
+def _semantic_cache_put(q_vec, username: str):
+    global _semantic_index, _semantic_vectors, _semantic_entries
+    if q_vec is None:
+        return
+    _semantic_vectors.append(q_vec[0])
+    _semantic_entries.append((time.time(), username))
+    if len(_semantic_entries) > QUERY_CACHE_MAX:
+        # IndexFlatIP cannot drop rows, so rebuild from the newest half
+        keep = QUERY_CACHE_MAX // 2
+        _semantic_vectors = _semantic_vectors[-keep:]
+        _semantic_entries = _semantic_entries[-keep:]
+        _semantic_index = None
+    if _semantic_index is None:
+        _semantic_index = faiss.IndexFlatIP(q_vec.shape[1])
+        _semantic_index.add(np.stack(_semantic_vectors))
+    else:
+        _semantic_index.add(q_vec)
+
+def _remember_result(query_key: str, q_vec, final_data: dict):
+    # Results are kept as usernames and re-read from the database, so a hit is never a stale copy
+    username = final_data.get("basic_info", {}).get("username")
+    if username:
+        _cache_put(query_key, username)
+        _semantic_cache_put(q_vec, username)
+
+def load_query_cache(path: str = QUERY_CACHE_FILE):
+    """Restore unexpired exact and semantic cache entries saved by an earlier run."""
+    global _semantic_index
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+        now = time.time()
+        for key, stored_at, value in data.get("entries", []):
+            if now - stored_at <= QUERY_CACHE_TTL_SECONDS:
+                _query_cache[key] = (stored_at, value)
+        for stored_at, username, vector in data.get("semantic", []):
+            if now - stored_at <= SEMANTIC_CACHE_TTL_SECONDS:
+                _semantic_vectors.append(np.asarray(vector, dtype=np.float32))
+                _semantic_entries.append((stored_at, username))
+        if _semantic_vectors:
+            _semantic_index = faiss.IndexFlatIP(len(_semantic_vectors[0]))
+            _semantic_index.add(np.stack(_semantic_vectors))
+    except Exception as e:
+        log.info("⚠️ Could not load query cache: %s", e)
+
+def save_query_cache(path: str = QUERY_CACHE_FILE):
+    """Persist the exact and semantic cache entries for the next run."""
+    data = {
+        "entries": [[key, stored_at, value] for key, (stored_at, value) in _query_cache.items()],
+        "semantic": [
+            [stored_at, username, vector]
+            for (stored_at, username), vector in zip(_semantic_entries, _semantic_vectors)
+        ],
+    }
+    try:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+    except Exception as e:
+        log.info("⚠️ Could not save query cache: %s", e)
+
+async def run_workflow(chat_message: str):
+    """Main workflow with improved error handling; independent I/O steps run concurrently."""
+    log.info("\n--- Starting workflow for query: '%s' ---", chat_message)
+    
+    # Validate input
+    if not chat_message or not chat_message.strip():
+        log.info("❌ Empty query provided")
+        return None
+    
+    query_key = _cache_key("final", chat_message)
+    cached_username = _cache_get(query_key)
+    cached_result = get_profile_from_cache(cached_username) if cached_username else None
+    if cached_result is not None:
+        log.info("🎯 Returning cached result for identical query")
+        display_final_report(cached_result)
+        return cached_result
+    
+    q_vec = _embed_query(chat_message)
+    similar_entry = _semantic_cache_get(q_vec)
+    if similar_entry is not None:
+        stored_at, similar_username = similar_entry
+        similar_result = get_profile_from_cache(similar_username)
+        if similar_result is not None:
+            log.info("🎯 Returning cached result for a near-identical query")
+            # Keep the original timestamp so the copy expires with the semantic entry
+            _cache_put(query_key, similar_username, stored_at)
+            display_final_report(similar_result)
+            return similar_result
+    
+    # Most queries name the handle directly, so look it up while search and selection run
+    guessed_username = chat_message.strip().replace(' ', '').lower()
+    guess_task = asyncio.create_task(asyncio.to_thread(check_profile_exists, guessed_username))
+    
+    try:
+        # Steps 2-4 (search, then one AI call that normalizes and selects), skipped for repeated queries
+        selection_key = _cache_key("selection", chat_message)
+        cached_selection = _cache_get(selection_key)
         
-        selection_text = message_model(prompt2, MODEL_SELECTOR)
-        if not selection_text:
-            # Fallback to first candidate
-            print("❌ AI selection failed, using first candidate")
-            first_candidate = candidates[0]
-            selected_profile = {
-                'name': chat_message,
-                'username': first_candidate['url'].split('/')[-1],
-                'instagram_url': first_candidate['url'],
-                'confidence': 0.5
-            }
+        if cached_selection is not None:
+            log.info("🎯 Using cached normalization and profile selection, skipping Steps 2-4")
+            normalized_data = cached_selection["normalized"]
+            selected_profile = cached_selection["selected"]
         else:
-            selected_profile = parse_profile_selection_response(selection_text)
-        
-        if not selected_profile or not selected_profile.get("instagram_url"):
-            print("❌ Could not determine Instagram profile")
-            return None
+            selected_profile = _match_known_profile(chat_message)
+            if selected_profile is not None:
+                log.info("🎯 '%s' matches known profile @%s, skipping Steps 2-4", chat_message, selected_profile['username'])
+                normalized_data = parse_normalization_response(None, chat_message)
+            else:
+                normalized_data, selected_profile = await _search_and_select_profile(chat_message)
+                if selected_profile is None:
+                    return None
+            _cache_put(selection_key, {"normalized": normalized_data, "selected": selected_profile})
         
-        print(f"✅ Selected profile: {selected_profile.get('username')} (confidence: {selected_profile.get('confidence', 0.5)})")
+        if log.isEnabledFor(logging.INFO):
+            log.info("✅ Normalized data: %s", orjson.dumps(normalized_data, option=orjson.OPT_INDENT_2).decode())
+        log.info("✅ Selected profile: %s (confidence: %s)", selected_profile.get('username'), selected_profile.get('confidence', 0.5))
         
         # Step 5: Format profile data
-        print("\n[Step 5] Formatting profile data...")
+        log.info("\n[Step 5] Formatting profile data...")
         profile_data = format_profile_data(selected_profile, chat_message)
         username = profile_data.get("username")
         
         if not username:
-            print("❌ Could not extract username")
+            log.info("❌ Could not extract username")
             return None
         
         # Step 6: Check cache
-        print(f"\n[Step 6] Checking cache for @{username}...")
-        exists, cached_data = check_profile_exists(username)
+        log.info("\n[Step 6] Checking cache for @%s...", username)
+        if username.lower() == guessed_username:
+            exists, cached_data = await guess_task
+        else:
+            guess_task.cancel()
+            exists, cached_data = await asyncio.to_thread(check_profile_exists, username)
         
         if exists and cached_data:
-            print(f"🎯 Using cached data for @{username}")
+            log.info("🎯 Using cached data for @%s", username)
             display_final_report(cached_data)
+            _remember_result(query_key, q_vec, cached_data)
             return cached_data
         
         # Step 7: Scrape fresh data
-        print(f"\n[Step 7] Scraping fresh data for @{username}...")
-        scraped_profile, posts_raw = scrape_complete_instagram_profile(username)
+        log.info("\n[Step 7] Scraping fresh data for @%s...", username)
+        scraped_profile, posts_raw = await scrape_complete_instagram_profile_async(username)
         
         has_profile = scraped_profile is not None
         has_posts = posts_raw and len(posts_raw) > 0
         
-        print(f"Scraping results:")
-        print(f"  - Profile info: {'✅' if has_profile else '❌'}")
-        print(f"  - Posts data: {'✅' if has_posts else '❌'} ({len(posts_raw) if posts_raw else 0} posts)")
+        log.info("Scraping results:")
+        log.info("  - Profile info: %s", '✅' if has_profile else '❌')
+        log.info("  - Posts data: %s (%d posts)", '✅' if has_posts else '❌', len(posts_raw) if posts_raw else 0)
         
         if not has_profile and not has_posts:
-            print(f"❌ No data found for @{username}")
+            log.info("❌ No data found for @%s", username)
             return None
         
         # Update profile data with scraped info
         if has_profile:
             profile_data.update(scraped_profile)
-            print(f"✅ Profile: {profile_data.get('name', 'N/A')} - {profile_data.get('followers_count', 0):,} followers")
+            log.info("✅ Profile: %s - %s followers", profile_data.get('name', 'N/A'), profile_data.get('followers_count', 0))
         
         # Process posts if available
         if has_posts:
-            print(f"\n[Step 8] Analyzing posts...")
+            log.info("\n[Step 8] Analyzing posts...")
             analyzed_posts = analyze_instagram_posts(posts_raw, username)
             
-            print(f"\n[Step 9] Aggregating metrics...")
+            log.info("\n[Step 9] Aggregating metrics...")
             metrics = aggregate_post_metrics(analyzed_posts)
             
-            print(f"\n[Step 10] Calculating scores...")
+            log.info("\n[Step 10] Calculating scores...")
             
-            # Simplified scoring prompt
-            prompt3 = f"""
-Based on these Instagram metrics, provide scores:
-
-Username: {username}
-Posts Analyzed: {metrics.get('postsAnalyzed', 0)}
-Average Engagement Rate: {metrics.get('avgEngagement_all', 0):.4f}
-Consistency Score: {metrics.get('consistencyScore', 75):.1f}
-
-Respond in this EXACT format:
-
-Authenticity: [score 0-100]
-Brand Safety: [score 0-100]
-Audience Match: [score 0-100]
-Content Quality: [score 0-100]
-"""
+            prompt3 = PROMPT_SCORING_TMPL.format(
+                username=username,
+                posts_analyzed=metrics.get('postsAnalyzed', 0),
+                avg_engagement=metrics.get('avgEngagement_all', 0),
+                consistency=metrics.get('consistencyScore', 75),
+            )
             
-            scoring_text = message_model(prompt3, MODEL_SCORING)
+            scoring_text = await asyncio.to_thread(_ask_model, prompt3, MODEL_SCORING)
             if scoring_text:
                 scores = parse_scoring_response(scoring_text, username, metrics)
             else:
-                print("⚠️ AI scoring failed, using manual calculation")
+                log.info("⚠️ AI scoring failed, using manual calculation")
                 scores = calculate_scores_manually(metrics, username)
                 
         else:
-            print("⚠️ No posts data - creating profile-only entry")
+            log.info("⚠️ No posts data - creating profile-only entry")
             analyzed_posts = []
             metrics = {}
             scores = {
@@ -224,31 +371,114 @@ Content Quality: [score 0-100]
         
         # Validate scores (ensure they're not all zero)
         if all(scores.get(key, 0) == 0 for key in ['Authenticity', 'BrandSafety', 'AudienceMatch', 'ContentQuality']):
-            print("⚠️ All scores are zero, recalculating...")
+            log.info("⚠️ All scores are zero, recalculating...")
             scores = calculate_scores_manually(metrics, username)
         
         # Step 11: Save to database
-        print(f"\n[Step 11] Saving to database...")
+        log.info("\n[Step 11] Saving to database...")
         success = insert_complete_profile(profile_data, analyzed_posts, metrics, scores)
         
         if success:
             final_data = get_profile_from_cache(username)
             display_final_report(final_data)
+            if final_data:
+                _remember_result(query_key, q_vec, final_data)
             return final_data
         else:
-            print("❌ Failed to save to database")
+            log.info("❌ Failed to save to database")
             return None
         
     except Exception as e:
-        print(f"\n❌ Workflow failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("\n❌ Workflow failed with error: %s", e)
         return None
+    finally:
+        if not guess_task.done():
+            guess_task.cancel()
+
+def _match_known_profile(chat_message: str):
+    """Select a profile already in the knowledge base when the query fuzzily names it."""
+    hits = knowledge_manager.match_names(chat_message, limit=3, score_cutoff=KNOWN_PROFILE_CANDIDATE_SCORE)
+    if not hits or hits[0][1] < KNOWN_PROFILE_MATCH_SCORE:
+        return None
+    
+    username, score = hits[0]
+    profile = knowledge_manager.influencer_profiles.get(username)
+    return {
+        'name': (profile.name if profile else None) or chat_message,
+        'username': username,
+        'instagram_url': f"https://www.instagram.com/{username}",
+        'confidence': score / 100
+    }
+
+async def _search_and_select_profile(chat_message: str):
+    """Steps 2-4: Google search, candidate filtering and a single AI call for normalization + selection."""
+    normalized_data = parse_normalization_response(None, chat_message)
+    
+    # Step 2: Search Google
+    log.info("\n[Step 2] Searching Google...")
+    search_results = await search_google_async(chat_message.strip())
+    
+    if not search_results:
+        log.info("❌ Google search failed")
+        return normalized_data, None
+    
+    organic_results = search_results.get('organic', [])
+    log.info("✅ Found %d search results", len(organic_results))
+    
+    # Step 3: Process search candidates
+    log.info("\n[Step 3] Processing search candidates...")
+    search_query, candidates = build_search_query_and_filter_candidates(
+        normalized_data, chat_message, search_results
+    )
+    
+    log.info("Found %d potential candidates", len(candidates))
+    
+    if not candidates:
+        log.info("❌ No suitable Instagram profiles found")
+        return normalized_data, None
+    
+    # Identical Serper result lists (bursts of users asking for the same name) resolve to the same profile
+    serper_key = hashlib.sha1(orjson.dumps([r.get("link") for r in organic_results])).hexdigest()
+    selected_profile = _selection_cache.get(serper_key)
+    if selected_profile is not None:
+        _selection_cache.move_to_end(serper_key)
+        log.info("🎯 Same search results as an earlier query, reusing its profile selection")
+        return normalized_data, selected_profile
+    
+    # Step 4: Normalize the query and select the official profile with AI
+    log.info("\n[Step 4] Normalizing query and selecting official profile with AI...")
+    prompt = PROMPT_NORMSELECT_TMPL.format(
+        query=chat_message,
+        candidates=orjson.dumps(candidates[:3], option=orjson.OPT_INDENT_2).decode(),
+    )
+    
+    selection_text = await asyncio.to_thread(_ask_model, prompt, MODEL_SELECTOR, SYSTEM_PROMPT_NORMSELECT)
+    if selection_text:
+        normalized_data, selected_profile = parse_normselect_response(selection_text, chat_message)
+    else:
+        selected_profile = {}
+    
+    if not selected_profile.get("instagram_url"):
+        # Fallback to first candidate
+        log.info("❌ AI selection failed, using first candidate")
+        first_candidate = candidates[0]
+        selected_profile = {
+            'name': chat_message,
+            'username': first_candidate['url'].split('/')[-1],
+            'instagram_url': first_candidate['url'],
+            'confidence': 0.5
+        }
+    else:
+        _selection_cache[serper_key] = selected_profile
+        if len(_selection_cache) > SELECTION_CACHE_MAX:
+            _selection_cache.popitem(last=False)
+    
+    return normalized_data, selected_profile
 
 def display_final_report(profile_data):
     """Display the final analysis report."""
     if not profile_data:
-        print("❌ No profile data to display")
+        log.info("❌ No profile data to display")
         return
     
     basic_info = profile_data.get("basic_info", {})
@@ -257,54 +487,65 @@ def display_final_report(profile_data):
     collaborations = profile_data.get("brand_collaborations", {})
     hashtags = profile_data.get("hashtags", {})
     
-    print("\n" + "="*60)
-    print("              INSTAGRAM ANALYSIS REPORT")
-    print("="*60)
-    print(f"Username: @{basic_info.get('username', 'N/A')}")
-    print(f"Name: {basic_info.get('name', 'N/A')}")
-    print(f"Verified: {'✅' if basic_info.get('is_verified') else '❌'}")
-    print(f"Business Account: {'✅' if basic_info.get('is_business_account') else '❌'}")
-    print("-" * 60)
-    print("FOLLOWER STATS")
-    print(f"Followers: {basic_info.get('followers_count', 0):,}")
-    print(f"Following: {basic_info.get('following_count', 0):,}")
-    print(f"Total Posts: {basic_info.get('posts_count', 0):,}")
-    print("-" * 60)
-    print("POST ANALYSIS")
-    print(f"Posts Analyzed: {posts.get('total_posts', 0)}")
-    print(f"Organic Posts: {len(posts.get('organic_posts', []))}")
-    print(f"Sponsored Posts: {len(posts.get('sponsored_posts', []))}")
-    print(f"Avg Likes: {analysis.get('avg_likes', 0):,.0f}")
-    print(f"Avg Comments: {analysis.get('avg_comments', 0):,.0f}")
-    print(f"Avg Views: {analysis.get('avg_views', 0):,.0f}")
-    print(f"Engagement Rate: {analysis.get('engagement_rate', 0):.3f}")
-    print("-" * 60)
-    print("BRAND COLLABORATIONS")
-    print(f"Total Sponsored Posts: {collaborations.get('total_sponsored_posts', 0)}")
-    print(f"Brands Worked With: {len(collaborations.get('brands_worked_with', []))}")
+    # Built in memory and emitted as a single log record
+    report = io.StringIO()
+    print("\n" + "="*60, file=report)
+    print("              INSTAGRAM ANALYSIS REPORT", file=report)
+    print("="*60, file=report)
+    print(f"Username: @{basic_info.get('username', 'N/A')}", file=report)
+    print(f"Name: {basic_info.get('name', 'N/A')}", file=report)
+    print(f"Verified: {'✅' if basic_info.get('is_verified') else '❌'}", file=report)
+    print(f"Business Account: {'✅' if basic_info.get('is_business_account') else '❌'}", file=report)
+    print("-" * 60, file=report)
+    print("FOLLOWER STATS", file=report)
+    print(f"Followers: {basic_info.get('followers_count', 0):,}", file=report)
+    print(f"Following: {basic_info.get('following_count', 0):,}", file=report)
+    print(f"Total Posts: {basic_info.get('posts_count', 0):,}", file=report)
+    print("-" * 60, file=report)
+    print("POST ANALYSIS", file=report)
+    print(f"Posts Analyzed: {posts.get('total_posts', 0)}", file=report)
+    print(f"Organic Posts: {len(posts.get('organic_posts', []))}", file=report)
+    print(f"Sponsored Posts: {len(posts.get('sponsored_posts', []))}", file=report)
+    print(f"Avg Likes: {analysis.get('avg_likes', 0):,.0f}", file=report)
+    print(f"Avg Comments: {analysis.get('avg_comments', 0):,.0f}", file=report)
+    print(f"Avg Views: {analysis.get('avg_views', 0):,.0f}", file=report)
+    print(f"Engagement Rate: {analysis.get('engagement_rate', 0):.3f}", file=report)
+    print("-" * 60, file=report)
+    print("BRAND COLLABORATIONS", file=report)
+    print(f"Total Sponsored Posts: {collaborations.get('total_sponsored_posts', 0)}", file=report)
+    print(f"Brands Worked With: {len(collaborations.get('brands_worked_with', []))}", file=report)
     if collaborations.get('brands_worked_with'):
-        print("Recent Brands: " + ", ".join(collaborations['brands_worked_with'][:5]))
-    print("-" * 60)
-    print("CONTENT INSIGHTS")
-    print(f"Unique Hashtags Used: {hashtags.get('total_unique', 0)}")
+        print("Recent Brands: " + ", ".join(collaborations['brands_worked_with'][:5]), file=report)
+    print("-" * 60, file=report)
+    print("CONTENT INSIGHTS", file=report)
+    print(f"Unique Hashtags Used: {hashtags.get('total_unique', 0)}", file=report)
     if hashtags.get('most_used'):
         top_hashtags = list(hashtags['most_used'].keys())[:5]
-        print(f"Top Hashtags: {', '.join(f'#{tag}' for tag in top_hashtags)}")
-    print("-" * 60)
-    print("INFLUENCE SCORES")
+        print(f"Top Hashtags: {', '.join(f'#{tag}' for tag in top_hashtags)}", file=report)
+    print("-" * 60, file=report)
+    print("INFLUENCE SCORES", file=report)
     scores = analysis.get('scores', {})
-    print(f"Authenticity: {scores.get('Authenticity', 0):.1f}/100")
-    print(f"Brand Safety: {scores.get('BrandSafety', 0):.1f}/100")
-    print(f"Audience Match: {scores.get('AudienceMatch', 0):.1f}/100")
-    print(f"Content Quality: {scores.get('ContentQuality', 0):.1f}/100")
-    print("="*60)
+    print(f"Authenticity: {scores.get('Authenticity', 0):.1f}/100", file=report)
+    print(f"Brand Safety: {scores.get('BrandSafety', 0):.1f}/100", file=report)
+    print(f"Audience Match: {scores.get('AudienceMatch', 0):.1f}/100", file=report)
+    print(f"Content Quality: {scores.get('ContentQuality', 0):.1f}/100", file=report)
+    print("="*60, file=report)
     
     metadata = profile_data.get("metadata", {})
-    print(f"Data cached on: {metadata.get('last_scraped', 'Unknown')}")
-    print("✅ Analysis completed successfully!")
+    print(f"Data cached on: {metadata.get('last_scraped', 'Unknown')}", file=report)
+    print("✅ Analysis completed successfully!", file=report)
+    log.info(report.getvalue().rstrip("\n"))
+
+async def _run_cli_workflow(query: str):
+    """Run the workflow and release the shared HTTP session before the event loop closes."""
+    try:
+        return await run_workflow(query)
+    finally:
+        await cleanup_async_resources()
 
 def main():
     """Main function."""
+    setup_logging()
     print("Instagram Influencer Analysis Tool")
     print("=" * 40)
     
@@ -332,13 +573,15 @@ def main():
         return
     
     # Run workflow
-    result = run_workflow(query)
+    load_query_cache()
+    result = asyncio.run(_run_cli_workflow(query))
+    save_query_cache()
     
     if result:
-        print(f"\n💾 Profile data saved to database")
-        print("🤖 Ready for chatbot integration!")
+        log.info("\n💾 Profile data saved to database")
+        log.info("🤖 Ready for chatbot integration!")
     else:
-        print("\n❌ Workflow failed to complete")
+        log.info("\n❌ Workflow failed to complete")
 
 if __name__ == '__main__':
     main()
@@ -1,10 +1,27 @@
 import json
 import os
+import hashlib
+import pickle
+import logging
+import time
+import random
 import asyncio
+import aiohttp
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from functools import lru_cache
+from itertools import accumulate
 from typing import Dict, Any, Tuple, Optional, List
-from database import get_database, get_profile_from_cache, insert_complete_profile
+from database import (
+    get_database,
+    get_profile_from_cache,
+    insert_complete_profile
+)
+from config import DATABASE_FILE
 from fast_semantic_matcher import fast_semantic_matcher
 from api_clients import (
+    build_influencer_context,
     spell_correct_influencer_name, 
     enhanced_influencer_normalization,
     spell_correct_influencer_name_async,
@@ -14,19 +31,169 @@ from api_clients import (
     message_model_async,
     run_async_in_sync,
     session_manager,
-    search_google,
-    scrape_complete_instagram_profile,
     message_model
 )
 # FIX: Add missing imports
 from workflow_logic import (
     build_search_query_and_filter_candidates,
     format_profile_data,
-    analyze_instagram_posts,
-    aggregate_post_metrics,
-    calculate_scores_manually
+    analyze_and_score_posts
 )
 
+# Milestones are INFO; per-step progress is debug-level and skipped unless enabled (see config.setup_logging)
+logger = logging.getLogger("unified_data_manager")
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = fuzz_process = None
+
+# Spelling corrections are reused for an hour; near-identical typos share one
+SPELL_CACHE_MAX = 10_000
+SPELL_CACHE_TTL_SECONDS = 3600
+SPELL_FUZZY_MIN_RATIO = 92
+NAME_FUZZY_MIN_SCORE = 85
+
+# Instagram scrapes allowed in flight at once, and retries after a failed scrape
+SCRAPE_CONCURRENCY = 3
+SCRAPE_RETRIES = 1
+
+# "not_influencer" / "not_found" outcomes are remembered for half an hour
+NEGATIVE_CACHE_MAX = 50_000
+NEGATIVE_CACHE_TTL_SECONDS = 1800
+
+# Embeddings lookup structures, reused across restarts while the embeddings rows are unchanged
+EMBEDDINGS_INDEX_CACHE_FILE = "embeddings_index.pkl"
+
+# Shared worker processes for CPU-bound post analysis, started on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+ANALYSIS_MAX_WORKERS = 4
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared analysis process pool"""
+    global _process_pool
+    if _process_pool is None:
+        # spawn, not fork: the host process already runs logging, prewarm and to_thread worker threads
+        _process_pool = ProcessPoolExecutor(
+            max_workers=min(ANALYSIS_MAX_WORKERS, os.cpu_count() or 1),
+            mp_context=get_context("spawn")
+        )
+    return _process_pool
+
+
+class _CharTrie:
+    """Minimal character trie supporting exact and longest-prefix lookups"""
+    
+    __slots__ = ("_root",)
+    # Child keys are single characters, so "" can never collide; unlike object() it survives pickling
+    _END = ""
+    
+    def __init__(self):
+        self._root = {}
+    
+    def setdefault(self, key: str, default):
+        node = self._root
+        for ch in key:
+            node = node.setdefault(ch, {})
+        return node.setdefault(self._END, default)
+    
+    def get(self, key: str, default=None):
+        node = self._root
+        for ch in key:
+            node = node.get(ch)
+            if node is None:
+                return default
+        return node.get(self._END, default)
+    
+    def longest_prefix(self, key: str, min_length: int = 1, ends: Optional[frozenset] = None):
+        """Value stored under the longest key that is a prefix of `key`, or None.
+        
+        With `ends`, only prefixes whose length is in it count (e.g. word boundaries of the query).
+        """
+        node = self._root
+        best = None
+        for depth, ch in enumerate(key, 1):
+            node = node.get(ch)
+            if node is None:
+                break
+            if depth >= min_length and self._END in node and (ends is None or depth in ends):
+                best = node[self._END]
+        return best
+
+
+# Static selection instructions go in the system turn so providers can cache them;
+# the user turn carries only the query and compact candidate JSON
+_SELECTION_SYSTEM = """You select the OFFICIAL Instagram profile for an influencer query.
+The user message is JSON with "query", "corrected" (spell-corrected name) and up to three search "candidates".
+Choose the candidate that matches the corrected name.
+
+Respond in this EXACT format:
+
+Name: [best name for this person]
+Username: [instagram username without @]
+Instagram URL: [full instagram.com URL]
+Confidence: [number between 0 and 1]
+"""
+_SELECTION_FIELDS = ("title", "url", "snippet")
+
+
+def _build_selection_request(original_name: str, corrected_name: str, candidates: List[Dict]) -> str:
+    """User turn for the selection call: query plus the top three trimmed candidates"""
+    trimmed = [{field: c.get(field, "") for field in _SELECTION_FIELDS} for c in candidates[:3]]
+    return json.dumps(
+        {"query": original_name, "corrected": corrected_name, "candidates": trimmed},
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+
+
+# Affixes tried around the space-stripped term when guessing a handle
+_USERNAME_SUFFIXES = ("22", "official", "real", "vlogs", "youtube")
+_USERNAME_PREFIXES = ("official", "real")
+
+
+@lru_cache(maxsize=4096)
+def _username_variations(term_lower: str) -> Tuple[str, ...]:
+    """Generate common username variations for an already-lowercased term"""
+    name_clean = term_lower.strip()
+    compact = name_clean.replace(" ", "")
+    suffixed = tuple(compact + suffix for suffix in _USERNAME_SUFFIXES)
+    prefixed = tuple(prefix + compact for prefix in _USERNAME_PREFIXES)
+    
+    # Single-word terms: the separator variants equal `compact`, so nothing needs deduplicating
+    if compact and " " not in name_clean:
+        return (compact,) + suffixed + prefixed
+    
+    variations = (compact, name_clean.replace(" ", "."), name_clean.replace(" ", "_")) + suffixed + prefixed
+    
+    # Remove duplicates and return unique variations
+    return tuple(dict.fromkeys(variations))
+
+
+def _unambiguous_fuzzy_match(search_lower: str, choices: List[str], owners: List[str]) -> Optional[str]:
+    """Owner of the best WRatio match, or None when nothing clears the cutoff or a different owner ties it"""
+    hits = fuzz_process.extract(
+        search_lower, choices, scorer=fuzz.WRatio, score_cutoff=NAME_FUZZY_MIN_SCORE, limit=2
+    )
+    if not hits:
+        return None
+    best = owners[hits[0][2]]
+    # e.g. "raj" scores the same against "raj shamani" and "rajat dalal"; don't guess between them
+    if len(hits) > 1 and hits[1][1] == hits[0][1] and owners[hits[1][2]] != best:
+        return None
+    return best
+
+
+@lru_cache(maxsize=4096)
+def _normalize_search_term(search_term: str) -> Tuple[str, Tuple[str, ...], frozenset]:
+    """Lowercased term, its words longer than two characters, and those words as a set (multi-word terms only)"""
+    search_lower = search_term.lower()
+    all_words = search_lower.split()
+    search_words = tuple(word for word in all_words if len(word) > 2)
+    search_words_set = frozenset(search_words) if len(all_words) > 1 else frozenset()
+    return search_lower, search_words, search_words_set
+
 
 class UnifiedDataManager:
     """FIXED: Manages access with spelling correction + auto-scraping + robust async"""
@@ -36,6 +203,37 @@ class UnifiedDataManager:
         self.embeddings_loaded = False
         self.auto_scraping_enabled = True
         self._progress_callback = None
+        # Influencer context list, rebuilt only after the databases change
+        self._avail_cache: Optional[List[Dict]] = None
+        self._context_blob: Optional[str] = None
+        self._avail_version = 0
+        self._spell_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        # Lowercased name/full_name -> username over main DB profiles
+        self._name_index: Optional[Dict[str, str]] = None
+        # mtime/size of the database file the name index was built from; other processes write it too
+        self._name_index_signature: Optional[Tuple[int, int]] = None
+        # Lowercased embeddings usernames and name tokens, fixed once the embeddings are loaded
+        self._emb_username_set: frozenset = frozenset()
+        self._embeddings_by_username_lower: Dict[str, Tuple[Dict, str]] = {}
+        self._username_trie = _CharTrie()
+        self._name_token_trie = _CharTrie()
+        # Main-format dicts built from embeddings rows, reset whenever the index is rebuilt
+        self._converted_cache: Dict[str, Dict] = {}
+        # Parallel lowercase columns for the substring fallback scans
+        self._emb_usernames: List[str] = []
+        self._emb_names_lower: List[str] = []
+        self._emb_name_word_sets: List[frozenset] = []
+        self._main_usernames: List[str] = []
+        self._main_names_lower: List[str] = []
+        self._main_fullnames_lower: List[str] = []
+        self._main_name_word_sets: List[frozenset] = []
+        self._name_choices: List[str] = []
+        self._name_owners: List[str] = []
+        self._scrape_sem: Optional[asyncio.Semaphore] = None
+        # Searches currently running, so identical concurrent queries share one pipeline
+        self._inflight: Dict[Tuple[str, bool], asyncio.Future] = {}
+        self._neg_cache: "OrderedDict[Tuple[str, bool], Tuple[float, str]]" = OrderedDict()
+        self._scrape_sem_loop = None
     
     def set_progress_callback(self, callback):
         """Set callback function for progress updates"""
@@ -49,26 +247,179 @@ class UnifiedDataManager:
             except:
                 pass  # Ignore callback errors
         else:
-            print(f"📊 {percentage}% - {message}")
+            logger.debug("📊 %s%% - %s", percentage, message)
     
     def ensure_all_data_loaded(self):
         """Ensure both databases are loaded"""
         if not self.embeddings_loaded:
             fast_semantic_matcher.load_precomputed_embeddings()
             self.embeddings_loaded = fast_semantic_matcher.is_loaded
+            if self.embeddings_loaded:
+                self._build_embeddings_index()
+        
+        if self._name_index is None or self._name_index_signature != self._database_signature():
+            self._build_name_index(get_database().get("profiles", {}))
         
         self.main_db_loaded = True  # Main DB loads automatically via get_database()
     
+    def _build_embeddings_index(self):
+        """Index embeddings usernames and name tokens for exact and prefix lookups"""
+        fingerprint = self._embeddings_fingerprint()
+        index = self._load_embeddings_index(fingerprint)
+        if index is None:
+            username_trie = _CharTrie()
+            name_token_trie = _CharTrie()
+            usernames, names_lower, name_word_sets = [], [], []
+            for username, influencer_data in fast_semantic_matcher.influencer_data.items():
+                name_lower = (influencer_data.get('name') or '').lower()
+                name_words = frozenset(name_lower.split())
+                username_trie.setdefault(username.lower(), username)
+                for token in name_words:
+                    name_token_trie.setdefault(token, []).append(username)
+                usernames.append(username)
+                names_lower.append(name_lower)
+                name_word_sets.append(name_words)
+            index = {
+                "usernames": usernames,
+                "names_lower": names_lower,
+                "name_word_sets": name_word_sets,
+                "username_trie": username_trie,
+                "name_token_trie": name_token_trie,
+            }
+            self._save_embeddings_index(fingerprint, index)
+        
+        # Row dicts are live objects from the matcher, so this map is never pickled
+        by_lower = {}
+        for username in index["usernames"]:
+            by_lower.setdefault(username.lower(), (fast_semantic_matcher.influencer_data[username], username))
+        
+        self._emb_usernames = index["usernames"]
+        self._emb_names_lower = index["names_lower"]
+        self._emb_name_word_sets = index["name_word_sets"]
+        self._embeddings_by_username_lower = by_lower
+        self._emb_username_set = frozenset(by_lower)
+        self._username_trie = index["username_trie"]
+        self._name_token_trie = index["name_token_trie"]
+        self._converted_cache = {}
+    
+    def _embeddings_fingerprint(self) -> str:
+        """sha1 over the (username, name) rows the embeddings index is built from"""
+        digest = hashlib.sha1()
+        for username, influencer_data in fast_semantic_matcher.influencer_data.items():
+            digest.update(f"{username}\x1f{influencer_data.get('name') or ''}\x1e".encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _load_embeddings_index(self, fingerprint: str) -> Optional[Dict]:
+        """Restore the lookup structures pickled for these exact embeddings rows"""
+        if not os.path.exists(EMBEDDINGS_INDEX_CACHE_FILE):
+            return None
+        
+        try:
+            with open(EMBEDDINGS_INDEX_CACHE_FILE, "rb") as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            logger.warning("⚠️ Ignoring unreadable embeddings index cache: %s", e)
+            return None
+        
+        if cached.get("fingerprint") != fingerprint:
+            return None
+        return cached["index"]
+    
+    def _save_embeddings_index(self, fingerprint: str, index: Dict):
+        """Persist the lookup structures; written to a temp file first so a partial save is never loaded"""
+        tmp_path = EMBEDDINGS_INDEX_CACHE_FILE + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"fingerprint": fingerprint, "index": index}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, EMBEDDINGS_INDEX_CACHE_FILE)
+        except Exception as e:
+            logger.warning("⚠️ Could not save embeddings index cache: %s", e)
+    
+    def _lookup_embeddings_index(self, search_lower: str, search_words: Tuple[str, ...]) -> Optional[str]:
+        """Resolve a term to an embeddings username via the index and tries, without scanning"""
+        # Exact and variation hits are plain dict probes; the tries only serve prefix/token matches
+        hit = self._embeddings_by_username_lower.get(search_lower)
+        if hit:
+            return hit[1]
+        
+        for variation in _username_variations(search_lower):
+            hit = self._embeddings_by_username_lower.get(variation)
+            if hit:
+                return hit[1]
+        
+        # A stored handle spelling the query's leading words, e.g. "carryminati official"; it must end
+        # on a word boundary so a short handle like "tech" can't claim "techburner"
+        word_ends = frozenset(accumulate(len(word) for word in search_lower.split(" ")))
+        username = self._username_trie.longest_prefix(search_lower.replace(" ", ""), min_length=4, ends=word_ends)
+        if username:
+            return username
+        
+        # Every meaningful query word appears in the stored name
+        if search_words:
+            postings = [self._name_token_trie.get(word) for word in search_words]
+            if all(postings):
+                common = set(postings[0]).intersection(*postings[1:])
+                for username in postings[0]:
+                    if username in common:
+                        return username
+        return None
+    
+    @staticmethod
+    def _database_signature() -> Optional[Tuple[int, int]]:
+        """mtime and size of the main database file, or None when it does not exist"""
+        try:
+            stat = os.stat(DATABASE_FILE)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _build_name_index(self, profiles: Dict):
+        """Index main DB profiles by lowercased name and full name"""
+        self._name_index_signature = self._database_signature()
+        name_index = {}
+        usernames, names_lower, fullnames_lower, name_word_sets = [], [], [], []
+        for username, profile_data in profiles.items():
+            basic_info = profile_data.get("basic_info", {})
+            name_lower = (basic_info.get("name") or "").lower()
+            fullname_lower = (basic_info.get("full_name") or "").lower()
+            for value in (name_lower, fullname_lower):
+                if value:
+                    name_index.setdefault(value, username)
+            usernames.append(username)
+            names_lower.append(name_lower)
+            fullnames_lower.append(fullname_lower)
+            name_word_sets.append(frozenset(name_lower.split()) | frozenset(fullname_lower.split()))
+        self._main_usernames = usernames
+        self._main_names_lower = names_lower
+        self._main_fullnames_lower = fullnames_lower
+        self._main_name_word_sets = name_word_sets
+        self._name_index = name_index
+        self._name_choices = list(name_index)
+        self._name_owners = list(name_index.values())
+    
+    def invalidate_cache(self):
+        """Drop data derived from the databases after a profile is saved"""
+        self._avail_cache = None
+        self._context_blob = None
+        self._name_index = None
+        self._name_index_signature = None
+        self._neg_cache.clear()  # A newly saved profile may answer an earlier miss
+        self._avail_version += 1
+    
     def get_available_influencers(self) -> List[Dict]:
         """Get list of available influencers from both databases for context"""
         self.ensure_all_data_loaded()
+        if self._avail_cache is not None:
+            return self._avail_cache
         
         influencers = []
+        main_keys = frozenset()
         
         # From main database
         try:
             db = get_database()
             profiles = db.get("profiles", {})
+            main_keys = frozenset(username.lower() for username in profiles)
             for username, profile_data in profiles.items():
                 basic_info = profile_data.get("basic_info", {})
                 influencers.append({
@@ -78,127 +429,139 @@ class UnifiedDataManager:
                     'source': 'main_db'
                 })
         except Exception as e:
-            print(f"Error loading main DB for context: {e}")
+            logger.warning("Error loading main DB for context: %s", e)
         
         # From embeddings database
         if self.embeddings_loaded:
-            for username, data in fast_semantic_matcher.influencer_data.items():
-                # Avoid duplicates
-                if not any(inf['username'].lower() == username.lower() for inf in influencers):
-                    influencers.append({
-                        'username': username,
-                        'name': data.get('name', ''),
-                        'followers': data.get('followers', 0),
-                        'source': 'embeddings'
-                    })
+            # Only usernames missing from the main DB; sorted so the prompt context is stable
+            for username_lower in sorted(self._emb_username_set - main_keys):
+                data, username = self._embeddings_by_username_lower[username_lower]
+                influencers.append({
+                    'username': username,
+                    'name': data.get('name', ''),
+                    'followers': data.get('followers', 0),
+                    'source': 'embeddings'
+                })
         
+        self._avail_cache = influencers
+        self._context_blob = build_influencer_context(influencers)
         return influencers
     
-    def find_influencer_anywhere(self, influencer_name: str, auto_scrape: bool = True) -> Tuple[bool, Optional[Dict], str]:
-        """ROBUST: Search with fallback to sync if async fails"""
-        try:
-            return run_async_in_sync(self.find_influencer_anywhere_async(influencer_name, auto_scrape))
-        except Exception as e:
-            print(f"Async search failed: {e}, falling back to sync")
-            return self._find_influencer_anywhere_sync(influencer_name, auto_scrape)
+    def get_influencer_context(self) -> str:
+        """Prompt-ready influencer context, built once per database version"""
+        if self._context_blob is None:
+            self.get_available_influencers()
+        return self._context_blob
     
-    def _find_influencer_anywhere_sync(self, influencer_name: str, auto_scrape: bool = True) -> Tuple[bool, Optional[Dict], str]:
-        """Synchronous fallback version of influencer search"""
-        self.ensure_all_data_loaded()
-        
-        print(f"🔍 Searching for: '{influencer_name}' (sync mode)")
-        self._update_progress(f"Searching for '{influencer_name}' (sync)", 10)
-        
-        # Step 1: Get available influencers for AI context
-        available_influencers = self.get_available_influencers()
-        print(f"📊 Using {len(available_influencers)} influencers for AI context")
-        
-        # Step 2: AI spelling correction (sync version)
-        self._update_progress("AI spell checking and name correction (sync)", 20)
-        spelling_result = spell_correct_influencer_name(influencer_name, available_influencers)
+    def _get_cached_spelling(self, influencer_name: str) -> Optional[Dict]:
+        """Return a fresh cached correction for this name or a near-identical one"""
+        key = influencer_name.strip().lower()
+        now = time.time()
+        hit = self._spell_cache.get(key)
+        if hit is not None:
+            if now - hit[0] < SPELL_CACHE_TTL_SECONDS:
+                self._spell_cache.move_to_end(key)
+                return hit[1]
+            del self._spell_cache[key]
         
-        if not spelling_result['is_influencer']:
-            print(f"❌ AI determined '{influencer_name}' is not an influencer name")
-            return False, None, "not_influencer"
-        
-        corrected_name = spelling_result['corrected_name']
-        confidence = spelling_result['confidence']
-        reasoning = spelling_result['reasoning']
-        
-        print(f"🤖 AI Correction: '{influencer_name}' → '{corrected_name}' (confidence: {confidence:.2f})")
-        print(f"💡 Reasoning: {reasoning}")
-        
-        # Step 3: Enhanced normalization
-        self._update_progress("Normalizing search terms", 30)
-        normalized = enhanced_influencer_normalization(corrected_name, available_influencers)
-        search_terms = [
-            corrected_name,
-            normalized.get('search_name', ''),
-            *normalized.get('aliases', []),
-            *normalized.get('handles', []),
-            influencer_name
-        ]
-        
-        # Remove duplicates and empty strings
-        search_terms = list(dict.fromkeys([term.strip() for term in search_terms if term and term.strip()]))
-        print(f"🔍 Search terms: {search_terms}")
-        
-        # Step 4: Try each search term in both databases
-        self._update_progress("Searching in local databases", 40)
-        for term in search_terms:
-            # Try main database first
-            found, data, username = self._search_main_database(term)
-            if found:
-                print(f"✅ Found '{influencer_name}' as '@{username}' in main database")
-                self._update_progress(f"Found in main database: @{username}", 100)
-                return True, data, f"main_db:@{username}"
-            
-            # Try embeddings database
-            found, data, username = self._search_embeddings_database(term)
-            if found:
-                print(f"✅ Found '{influencer_name}' as '@{username}' in embeddings database")
-                self._update_progress(f"Found in embeddings database: @{username}", 100)
-                return True, data, f"embeddings:@{username}"
+        if fuzz is not None:
+            for cached_name, (stored_at, result) in reversed(self._spell_cache.items()):
+                if now - stored_at < SPELL_CACHE_TTL_SECONDS and fuzz.ratio(key, cached_name) > SPELL_FUZZY_MIN_RATIO:
+                    logger.info("♻️ Reusing spelling correction of '%s' for '%s'", cached_name, influencer_name)
+                    return result
+        return None
+    
+    def _store_spelling(self, influencer_name: str, result: Dict):
+        """Remember a spelling correction result, evicting the oldest past the cap"""
+        self._spell_cache[influencer_name.strip().lower()] = (time.time(), result)
+        while len(self._spell_cache) > SPELL_CACHE_MAX:
+            self._spell_cache.popitem(last=False)
+    
+    def find_influencer_anywhere(self, influencer_name: str, auto_scrape: bool = True) -> Tuple[bool, Optional[Dict], str]:
+        """Synchronous entry point; runs the async search through the event-loop bridge"""
+        return run_async_in_sync(self.find_influencer_anywhere_async(influencer_name, auto_scrape))
+    
+    async def find_influencer_anywhere_async(self, influencer_name: str, auto_scrape: bool = True,
+                                             session: aiohttp.ClientSession = None) -> Tuple[bool, Optional[Dict], str]:
+        """Coalesce concurrent searches for the same name onto one pipeline run"""
+        key = (influencer_name.strip().lower(), auto_scrape)
+        reason = self._get_negative(key)
+        if reason is not None:
+            logger.info("🚫 '%s' recently resolved to %s, skipping search", influencer_name, reason)
+            return False, None, reason
         
-        # Step 5: AUTO-SCRAPING (sync version)
-        if auto_scrape and self.auto_scraping_enabled:
-            print(f"🤖 '{influencer_name}' not found in databases - attempting auto-scraping (sync)...")
-            self._update_progress("Not found locally - starting auto-scraping (sync)", 45)
-            return self._auto_scrape_and_save_sync(influencer_name, corrected_name, normalized)
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            logger.info("🔗 Joining in-flight search for '%s'", influencer_name)
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The leader was cancelled, not us: retry, so one joiner leads a fresh run
+                logger.info("🔁 In-flight search for '%s' was cancelled, retrying", influencer_name)
+                return await self.find_influencer_anywhere_async(influencer_name, auto_scrape, session)
         
-        print(f"❌ No matches found for '{influencer_name}' or '{corrected_name}'")
-        self._update_progress("No matches found", 100)
-        return False, None, "not_found"
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._find_influencer_pipeline_async(influencer_name, auto_scrape, session)
+            if result[2] in ("not_influencer", "not_found"):
+                self._remember_negative(key, result[2])
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
     
-    async def find_influencer_anywhere_async(self, influencer_name: str, auto_scrape: bool = True) -> Tuple[bool, Optional[Dict], str]:
+    async def _find_influencer_pipeline_async(self, influencer_name: str, auto_scrape: bool = True,
+                                              session: aiohttp.ClientSession = None) -> Tuple[bool, Optional[Dict], str]:
         """ASYNC OPTIMIZED: Search with AI spelling correction + automatic scraping"""
         self.ensure_all_data_loaded()
+        if session is None:
+            session = await session_manager.get_session()
         
-        print(f"🔍 Searching for: '{influencer_name}'")
+        logger.debug("🔍 Searching for: '%s'", influencer_name)
         self._update_progress(f"Searching for '{influencer_name}'", 10)
         
         # Step 1: Get available influencers for AI context
         available_influencers = self.get_available_influencers()
-        print(f"📊 Using {len(available_influencers)} influencers for AI context")
+        logger.debug("📊 Using %s influencers for AI context", len(available_influencers))
         
         # Step 2: AI spelling correction (async)
         self._update_progress("AI spell checking and name correction", 20)
-        try:
-            spelling_result = await spell_correct_influencer_name_async(influencer_name, available_influencers)
-        except Exception as e:
-            print(f"Async spelling correction failed: {e}, using sync")
-            spelling_result = spell_correct_influencer_name(influencer_name, available_influencers)
+        spelling_result = self._get_cached_spelling(influencer_name)
+        if spelling_result is None:
+            influencer_context = self.get_influencer_context()
+            try:
+                spelling_result = await spell_correct_influencer_name_async(
+                    influencer_name, influencer_context=influencer_context, session=session
+                )
+            except Exception as e:
+                logger.warning("Async spelling correction failed: %s, using sync", e)
+                spelling_result = spell_correct_influencer_name(
+                    influencer_name, influencer_context=influencer_context
+                )
+            self._store_spelling(influencer_name, spelling_result)
         
         if not spelling_result['is_influencer']:
-            print(f"❌ AI determined '{influencer_name}' is not an influencer name")
+            logger.info("❌ AI determined '%s' is not an influencer name", influencer_name)
             return False, None, "not_influencer"
         
         corrected_name = spelling_result['corrected_name']
         confidence = spelling_result['confidence']
         reasoning = spelling_result['reasoning']
         
-        print(f"🤖 AI Correction: '{influencer_name}' → '{corrected_name}' (confidence: {confidence:.2f})")
-        print(f"💡 Reasoning: {reasoning}")
+        logger.info("🤖 AI Correction: '%s' → '%s' (confidence: %.2f)", influencer_name, corrected_name, confidence)
+        logger.debug("💡 Reasoning: %s", reasoning)
         
         # Step 3: Enhanced normalization with database context
         self._update_progress("Normalizing search terms", 30)
@@ -212,209 +575,48 @@ class UnifiedDataManager:
         ]
         
         # Remove duplicates and empty strings
-        search_terms = list(dict.fromkeys([term.strip() for term in search_terms if term and term.strip()]))
-        print(f"🔍 Search terms: {search_terms}")
+        search_terms = list(dict.fromkeys(term.strip().lower() for term in search_terms if term and term.strip()))
+        logger.debug("🔍 Search terms: %s", search_terms)
         
-        # Step 4: Try each search term in both databases
+        # Step 4: Search every term in both databases, in priority order
         self._update_progress("Searching in local databases", 40)
-        for term in search_terms:
-            # Try main database first
-            found, data, username = self._search_main_database(term)
-            if found:
-                print(f"✅ Found '{influencer_name}' as '@{username}' in main database")
-                self._update_progress(f"Found in main database: @{username}", 100)
-                return True, data, f"main_db:@{username}"
-            
-            # Try embeddings database
-            found, data, username = self._search_embeddings_database(term)
-            if found:
-                print(f"✅ Found '{influencer_name}' as '@{username}' in embeddings database")
-                self._update_progress(f"Found in embeddings database: @{username}", 100)
-                return True, data, f"embeddings:@{username}"
+        found, data, source = await self._search_local_databases_async(search_terms)
+        if found:
+            label = "main database" if source.startswith("main_db") else "embeddings database"
+            logger.info("✅ Found '%s' as '%s' in %s", influencer_name, source.split(':', 1)[1], label)
+            self._update_progress(f"Found in {label}: {source.split(':', 1)[1]}", 100)
+            return True, data, source
         
         # Step 5: AUTO-SCRAPING with async optimizations
         if auto_scrape and self.auto_scraping_enabled:
-            print(f"🤖 '{influencer_name}' not found in databases - attempting auto-scraping...")
+            logger.info("🤖 '%s' not found in databases - attempting auto-scraping...", influencer_name)
             self._update_progress("Not found locally - starting auto-scraping", 45)
-            try:
-                return await self._auto_scrape_and_save_async(influencer_name, corrected_name, normalized)
-            except Exception as e:
-                print(f"Async auto-scraping failed: {e}, trying sync")
-                return self._auto_scrape_and_save_sync(influencer_name, corrected_name, normalized)
+            return await self._auto_scrape_and_save_async(influencer_name, corrected_name, normalized, session)
         
-        print(f"❌ No matches found for '{influencer_name}' or '{corrected_name}'")
+        logger.info("❌ No matches found for '%s' or '%s'", influencer_name, corrected_name)
         self._update_progress("No matches found", 100)
         return False, None, "not_found"
     
-    def _auto_scrape_and_save_sync(self, original_name: str, corrected_name: str, normalized_data: dict) -> Tuple[bool, Optional[Dict], str]:
-        """Synchronous version of auto-scraping"""
-        from config import MODEL_SELECTOR
-        
-        try:
-            print(f"🕷️ Starting sync auto-scraping workflow for '{original_name}'...")
-            self._update_progress("Starting auto-scraping workflow (sync)", 50)
-            
-            # Step 1: Google search
-            self._update_progress("Searching Google for Instagram profiles", 55)
-            search_name = normalized_data.get('search_name', corrected_name)
-            search_results = search_google(search_name)
-            
-            if not search_results:
-                print("❌ Google search failed during auto-scraping")
-                self._update_progress("Google search failed", 100)
-                return False, None, "scraping_failed"
-            
-            # Step 2: Find Instagram candidates
-            self._update_progress("Analyzing Instagram profile candidates", 60)
-            search_query, candidates = build_search_query_and_filter_candidates(
-                normalized_data, original_name, search_results
-            )
-            
-            if not candidates:
-                print("❌ No Instagram candidates found during auto-scraping")
-                self._update_progress("No Instagram profiles found", 100)
-                return False, None, "scraping_failed"
-            
-            print(f"🎯 Found {len(candidates)} Instagram candidates")
-            
-            # Step 3: AI selects official profile
-            self._update_progress("AI selecting official profile", 65)
-            selection_prompt = f"""
-Query: "{original_name}" (corrected: "{corrected_name}")
-
-Instagram profile candidates found:
-{json.dumps(candidates[:3], indent=2)}
-
-Choose the OFFICIAL Instagram profile that matches "{corrected_name}". 
-
-Respond in this EXACT format:
-
-Name: [best name for this person]
-Username: [instagram username without @]
-Instagram URL: [full instagram.com URL]
-Confidence: [number between 0 and 1]
-"""
-            
-            selection_text = message_model(selection_prompt, MODEL_SELECTOR)
-            if not selection_text:
-                print("❌ AI profile selection failed during auto-scraping")
-                self._update_progress("AI profile selection failed", 100)
-                return False, None, "scraping_failed"
-            
-            selected_profile = parse_profile_selection_response(selection_text)
-            
-            if not selected_profile or not selected_profile.get("instagram_url"):
-                print("❌ Could not determine Instagram profile during auto-scraping")
-                self._update_progress("Could not determine profile", 100)
-                return False, None, "scraping_failed"
-            
-            # Step 4: Format and extract username
-            profile_data = format_profile_data(selected_profile, original_name)
-            username = profile_data.get("username")
-            
-            if not username:
-                print("❌ Could not extract username during auto-scraping")
-                self._update_progress("Could not extract username", 100)
-                return False, None, "scraping_failed"
-            
-            print(f"🎯 Selected profile: @{username} (confidence: {selected_profile.get('confidence', 0.5)})")
-            self._update_progress(f"Selected profile: @{username}", 70)
-            
-            # Step 5: Scrape profile and posts (sync)
-            print(f"🚀 Starting scraping for @{username}...")
-            self._update_progress(f"Scraping profile and posts for @{username}", 75)
-            
-            scraped_profile, posts_raw = scrape_complete_instagram_profile(username)
-            
-            has_profile = scraped_profile is not None
-            has_posts = posts_raw and len(posts_raw) > 0
-            
-            print(f"Scraping results:")
-            print(f"  - Profile info: {'✅' if has_profile else '❌'}")
-            print(f"  - Posts data: {'✅' if has_posts else '❌'} ({len(posts_raw) if posts_raw else 0} posts)")
-            
-            if not has_profile:
-                print(f"❌ Failed to scrape profile data for @{username}")
-                self._update_progress("Failed to scrape profile data", 100)
-                return False, None, "scraping_failed"
-            
-            # Step 6: Update profile data
-            profile_data.update(scraped_profile)
-            print(f"✅ Profile: {profile_data.get('name', 'N/A')} - {profile_data.get('followers_count', 0):,} followers")
-            self._update_progress(f"Found: {profile_data.get('name', 'N/A')} - {profile_data.get('followers_count', 0):,} followers", 85)
-            
-            # Step 7: Analyze posts and calculate scores
-            if has_posts:
-                print(f"📊 Analyzing {len(posts_raw)} posts...")
-                self._update_progress(f"Analyzing {len(posts_raw)} posts", 90)
-                
-                analyzed_posts = analyze_instagram_posts(posts_raw, username)
-                metrics = aggregate_post_metrics(analyzed_posts)
-                scores = calculate_scores_manually(metrics, username)
-            else:
-                print("⚠️ No posts data - creating profile-only entry")
-                self._update_progress("No posts found - creating profile-only entry", 90)
-                analyzed_posts = []
-                metrics = {}
-                scores = {
-                    "username": username,
-                    "postsAnalyzed": 0,
-                    "avgER_organic": 0,
-                    "avgER_sponsored": 0,
-                    "avgLikes": 0,
-                    "avg_sponsored_likes": 0,
-                    "avgComments": 0,
-                    "avg_sponsored_comments": 0,
-                    "avgViews": 0,
-                    "Authenticity": 70.0,
-                    "BrandSafety": 85.0,
-                    "AudienceMatch": 60.0,
-                    "ContentQuality": 65.0,
-                }
-            
-            # Step 8: Save to database
-            print(f"💾 Saving auto-scraped data to database...")
-            self._update_progress("Saving to database", 95)
-            success = insert_complete_profile(profile_data, analyzed_posts, metrics, scores)
-            
-            if success:
-                print(f"✅ Successfully auto-scraped and saved @{username}")
-                self._update_progress(f"Successfully saved @{username}", 100)
-                
-                # Retrieve saved data and return
-                final_data = get_profile_from_cache(username)
-                if final_data:
-                    return True, final_data, f"auto_scraped:@{username}"
-                else:
-                    print("❌ Failed to retrieve saved data")
-                    return False, None, "scraping_failed"
-            else:
-                print(f"❌ Failed to save auto-scraped data for @{username}")
-                self._update_progress("Failed to save data", 100)
-                return False, None, "scraping_failed"
-                
-        except Exception as e:
-            print(f"❌ Sync auto-scraping failed with error: {e}")
-            import traceback
-            traceback.print_exc()
-            self._update_progress(f"Auto-scraping failed: {str(e)}", 100)
-            return False, None, "scraping_failed"
-    
-    async def _auto_scrape_and_save_async(self, original_name: str, corrected_name: str, normalized_data: dict) -> Tuple[bool, Optional[Dict], str]:
+    async def _auto_scrape_and_save_async(self, original_name: str, corrected_name: str, normalized_data: dict,
+                                          session: aiohttp.ClientSession = None) -> Tuple[bool, Optional[Dict], str]:
         """ASYNC OPTIMIZED: Automatically scrape influencer data and save to database"""  
         from config import MODEL_SELECTOR
         
+        if session is None:
+            session = await session_manager.get_session()
+        
+        speculative_scrape = None
         try:
-            print(f"🕷️ Starting async auto-scraping workflow for '{original_name}'...")
+            logger.info("🕷️ Starting async auto-scraping workflow for '%s'...", original_name)
             self._update_progress("Starting auto-scraping workflow", 50)
             
             # Step 1: Async Google search for Instagram profile
             self._update_progress("Searching Google for Instagram profiles", 55)
             search_name = normalized_data.get('search_name', corrected_name)
-            search_results = await search_google_async(search_name)
+            search_results = await search_google_async(search_name, session)
             
             if not search_results:
-                print("❌ Google search failed during auto-scraping")
+                logger.warning("❌ Google search failed during auto-scraping")
                 self._update_progress("Google search failed", 100)
                 return False, None, "scraping_failed"
             
@@ -425,46 +627,43 @@ Confidence: [number between 0 and 1]
             )
             
             if not candidates:
-                print("❌ No Instagram candidates found during auto-scraping")
+                logger.warning("❌ No Instagram candidates found during auto-scraping")
                 self._update_progress("No Instagram profiles found", 100)
                 return False, None, "scraping_failed"
             
-            print(f"🎯 Found {len(candidates)} Instagram candidates")
+            logger.debug("🎯 Found %s Instagram candidates", len(candidates))
+            
+            # Speculatively scrape the top candidate while the AI decides
+            speculative_username = format_profile_data(
+                {"instagram_url": candidates[0].get("url", "")}, original_name
+            ).get("username")
+            if speculative_username:
+                speculative_scrape = asyncio.create_task(
+                    self._scrape_profile_limited(speculative_username, session),
+                    name=f"speculative_scrape_{speculative_username}"
+                )
             
             # Step 3: AI selects official profile (async)
             self._update_progress("AI selecting official profile", 65)
-            selection_prompt = f"""
-Query: "{original_name}" (corrected: "{corrected_name}")
-
-Instagram profile candidates found:
-{json.dumps(candidates[:3], indent=2)}
-
-Choose the OFFICIAL Instagram profile that matches "{corrected_name}". 
-
-Respond in this EXACT format:
-
-Name: [best name for this person]
-Username: [instagram username without @]
-Instagram URL: [full instagram.com URL]
-Confidence: [number between 0 and 1]
-"""
+            selection_request = _build_selection_request(original_name, corrected_name, candidates)
             
             try:
-                session = await session_manager.get_session()
-                selection_text = await message_model_async(session, selection_prompt, MODEL_SELECTOR)
+                selection_text = await message_model_async(
+                    session, selection_request, MODEL_SELECTOR, system=_SELECTION_SYSTEM
+                )
             except Exception as e:
-                print(f"Async AI call failed: {e}, trying sync")
-                selection_text = message_model(selection_prompt, MODEL_SELECTOR)
+                logger.warning("Async AI call failed: %s, trying sync", e)
+                selection_text = message_model(selection_request, MODEL_SELECTOR, system=_SELECTION_SYSTEM)
             
             if not selection_text:
-                print("❌ AI profile selection failed during auto-scraping")
+                logger.warning("❌ AI profile selection failed during auto-scraping")
                 self._update_progress("AI profile selection failed", 100)
                 return False, None, "scraping_failed"
             
             selected_profile = parse_profile_selection_response(selection_text)
             
             if not selected_profile or not selected_profile.get("instagram_url"):
-                print("❌ Could not determine Instagram profile during auto-scraping")
+                logger.warning("❌ Could not determine Instagram profile during auto-scraping")
                 self._update_progress("Could not determine profile", 100)
                 return False, None, "scraping_failed"
             
@@ -473,50 +672,50 @@ Confidence: [number between 0 and 1]
             username = profile_data.get("username")
             
             if not username:
-                print("❌ Could not extract username during auto-scraping")
+                logger.warning("❌ Could not extract username during auto-scraping")
                 self._update_progress("Could not extract username", 100)
                 return False, None, "scraping_failed"
             
-            print(f"🎯 Selected profile: @{username} (confidence: {selected_profile.get('confidence', 0.5)})")
+            logger.debug("🎯 Selected profile: @%s (confidence: %s)", username, selected_profile.get('confidence', 0.5))
             self._update_progress(f"Selected profile: @{username}", 70)
             
             # Step 5: PARALLEL ASYNC SCRAPING (Major optimization!)
-            print(f"🚀 Starting parallel scraping for @{username}...")
+            logger.debug("🚀 Starting parallel scraping for @%s...", username)
             self._update_progress(f"Scraping profile and posts for @{username}", 75)
             
-            scraped_profile, posts_raw = await scrape_complete_instagram_profile_async(username)
+            if speculative_scrape is not None and username.lower() == speculative_username.lower():
+                logger.info("⚡ Using speculative scrape of @%s", speculative_username)
+                scraped_profile, posts_raw = await speculative_scrape
+            else:
+                if speculative_scrape is not None:
+                    speculative_scrape.cancel()
+                scraped_profile, posts_raw = await self._scrape_profile_limited(username, session)
             
             has_profile = scraped_profile is not None
             has_posts = posts_raw and len(posts_raw) > 0
             
-            print(f"Scraping results:")
-            print(f"  - Profile info: {'✅' if has_profile else '❌'}")
-            print(f"  - Posts data: {'✅' if has_posts else '❌'} ({len(posts_raw) if posts_raw else 0} posts)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Scraping results:")
+                logger.debug("  - Profile info: %s", '✅' if has_profile else '❌')
+                logger.debug("  - Posts data: %s (%s posts)", '✅' if has_posts else '❌', len(posts_raw) if posts_raw else 0)
             
             if not has_profile:
-                print(f"❌ Failed to scrape profile data for @{username}")
+                logger.warning("❌ Failed to scrape profile data for @%s", username)
                 self._update_progress("Failed to scrape profile data", 100)
                 return False, None, "scraping_failed"
             
             # Step 6: Update profile data with scraped info
             profile_data.update(scraped_profile)
-            print(f"✅ Profile: {profile_data.get('name', 'N/A')} - {profile_data.get('followers_count', 0):,} followers")
+            logger.info("✅ Profile: %s - %s followers", profile_data.get('name', 'N/A'), profile_data.get('followers_count', 0))
             self._update_progress(f"Found: {profile_data.get('name', 'N/A')} - {profile_data.get('followers_count', 0):,} followers", 85)
             
             # Step 7: Analyze posts and calculate scores (background processing)
             if has_posts:
-                print(f"📊 Analyzing {len(posts_raw)} posts...")
+                logger.debug("📊 Analyzing %s posts...", len(posts_raw))
                 self._update_progress(f"Analyzing {len(posts_raw)} posts", 90)
-                
-                # Run analysis in background task for better UX
-                analysis_task = asyncio.create_task(
-                    self._analyze_posts_async(posts_raw, username),
-                    name=f"analysis_{username}"
-                )
-                
-                analyzed_posts, metrics, scores = await analysis_task
+                analyzed_posts, metrics, scores = await self._analyze_posts_async(posts_raw, username)
             else:
-                print("⚠️ No posts data - creating profile-only entry")
+                logger.info("⚠️ No posts data - creating profile-only entry")
                 self._update_progress("No posts found - creating profile-only entry", 90)
                 analyzed_posts = []
                 metrics = {}
@@ -536,13 +735,16 @@ Confidence: [number between 0 and 1]
                     "ContentQuality": 65.0,
                 }
             
-            # Step 8: Save to database
-            print(f"💾 Saving auto-scraped data to database...")
+            # Step 8: Save to database, once, only after analysis succeeded so no partial row is ever visible
+            logger.debug("💾 Saving auto-scraped data to database...")
             self._update_progress("Saving to database", 95)
-            success = insert_complete_profile(profile_data, analyzed_posts, metrics, scores)
+            success = await asyncio.to_thread(
+                insert_complete_profile, profile_data, analyzed_posts, metrics, scores
+            )
             
             if success:
-                print(f"✅ Successfully auto-scraped and saved @{username}")
+                self.invalidate_cache()
+                logger.info("✅ Successfully auto-scraped and saved @%s", username)
                 self._update_progress(f"Successfully saved @{username}", 100)
                 
                 # Retrieve saved data and return
@@ -550,106 +752,145 @@ Confidence: [number between 0 and 1]
                 if final_data:
                     return True, final_data, f"auto_scraped:@{username}"
                 else:
-                    print("❌ Failed to retrieve saved data")
+                    logger.warning("❌ Failed to retrieve saved data")
                     return False, None, "scraping_failed"
             else:
-                print(f"❌ Failed to save auto-scraped data for @{username}")
+                logger.warning("❌ Failed to save auto-scraped data for @%s", username)
                 self._update_progress("Failed to save data", 100)
                 return False, None, "scraping_failed"
                 
         except Exception as e:
-            print(f"❌ Async auto-scraping failed with error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Auto-scraping failed for '%s'", original_name)
             self._update_progress(f"Auto-scraping failed: {str(e)}", 100)
             return False, None, "scraping_failed"
+        finally:
+            if speculative_scrape is not None and not speculative_scrape.done():
+                speculative_scrape.cancel()
+    
+    def _get_negative(self, key: Tuple[str, bool]) -> Optional[str]:
+        """Return a cached negative outcome for this search if it has not expired"""
+        hit = self._neg_cache.get(key)
+        if hit is None:
+            return None
+        if time.time() - hit[0] >= NEGATIVE_CACHE_TTL_SECONDS:
+            del self._neg_cache[key]
+            return None
+        return hit[1]
+    
+    def _remember_negative(self, key: Tuple[str, bool], reason: str):
+        """Cache a negative outcome, evicting the oldest entries past the cap"""
+        self._neg_cache[key] = (time.time(), reason)
+        self._neg_cache.move_to_end(key)
+        while len(self._neg_cache) > NEGATIVE_CACHE_MAX:
+            self._neg_cache.popitem(last=False)
+    
+    def _get_scrape_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent Instagram scrapes on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._scrape_sem is None or self._scrape_sem_loop is not loop:
+            self._scrape_sem = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+            self._scrape_sem_loop = loop
+        return self._scrape_sem
+    
+    async def _scrape_profile_limited(self, username: str, session: aiohttp.ClientSession = None) -> Tuple[Optional[Dict], List[Dict]]:
+        """Scrape a profile under the concurrency cap, retrying once with jittered backoff"""
+        async with self._get_scrape_semaphore():
+            for attempt in range(SCRAPE_RETRIES + 1):
+                scraped_profile, posts_raw = await scrape_complete_instagram_profile_async(username, session)
+                if scraped_profile is not None:
+                    break
+                if attempt < SCRAPE_RETRIES:
+                    delay = random.uniform(0.5, 2.0)
+                    logger.warning("⏳ Scrape of @%s failed, retrying in %.1fs", username, delay)
+                    await asyncio.sleep(delay)
+        return scraped_profile, posts_raw
     
     async def _analyze_posts_async(self, posts_raw: List[Dict], username: str) -> Tuple[List[Dict], Dict, Dict]:
         """Async post analysis for background processing"""
         try:
-            # Create async task for analysis
-            analysis_task = asyncio.create_task(
-                asyncio.to_thread(analyze_instagram_posts, posts_raw, username),
-                name=f"analyze_posts_{username}"
-            )
-            
-            analyzed_posts = await analysis_task
-            
-            # Aggregate metrics
-            metrics_task = asyncio.create_task(
-                asyncio.to_thread(aggregate_post_metrics, analyzed_posts),
-                name=f"aggregate_metrics_{username}"
-            )
-            
-            metrics = await metrics_task
-            
-            # Calculate scores
-            scores_task = asyncio.create_task(
-                asyncio.to_thread(calculate_scores_manually, metrics, username),
-                name=f"calculate_scores_{username}"
-            )
+            loop = asyncio.get_running_loop()
+            pool = _get_process_pool()
             
-            scores = await scores_task
-            
-            return analyzed_posts, metrics, scores
+            # CPU-bound analysis runs in a worker process; the posts cross the process boundary once
+            return await loop.run_in_executor(pool, analyze_and_score_posts, posts_raw, username)
             
         except Exception as e:
-            print(f"Error in async post analysis: {e}")
+            logger.warning("Error in async post analysis: %s", e)
             # Fallback to sync
             try:
-                analyzed_posts = analyze_instagram_posts(posts_raw, username)
-                metrics = aggregate_post_metrics(analyzed_posts)
-                scores = calculate_scores_manually(metrics, username)
-                return analyzed_posts, metrics, scores
+                return analyze_and_score_posts(posts_raw, username)
             except:
                 return [], {}, {}
     
-    def _search_main_database(self, search_term: str) -> Tuple[bool, Optional[Dict], str]:
+    async def _search_local_databases_async(self, search_terms: List[str]) -> Tuple[bool, Optional[Dict], str]:
+        """Run the local database search off the event loop"""
+        return await asyncio.to_thread(self._search_local_databases, search_terms)
+    
+    def _search_local_databases(self, search_terms: List[str]) -> Tuple[bool, Optional[Dict], str]:
+        """First hit in priority order: terms in order, main DB before embeddings for each term"""
+        # One snapshot of the main DB shared by every lookup instead of a file read per term
+        profiles = get_database().get("profiles", {})
+        
+        for term in search_terms:
+            found, data, username = self._search_main_database(term, profiles)
+            if found:
+                return True, data, f"main_db:@{username}"
+            
+            found, data, username = self._search_embeddings_database(term)
+            if found:
+                return True, data, f"embeddings:@{username}"
+        
+        return False, None, ""
+    
+    def _search_main_database(self, search_term: str, profiles: Optional[Dict] = None) -> Tuple[bool, Optional[Dict], str]:
         """Enhanced search in main database with fuzzy matching"""
+        if profiles is None:
+            profiles = get_database().get("profiles", {})
+        
+        search_lower, _, search_words_set = _normalize_search_term(search_term)
         
         # Direct username lookup
-        cached_data = get_profile_from_cache(search_term.lower())
+        cached_data = profiles.get(search_lower)
         if cached_data:
-            return True, cached_data, search_term.lower()
+            return True, cached_data, search_lower
+        
+        # Exact name / full name via the index
+        if self._name_index is None or self._name_index_signature != self._database_signature():
+            self._build_name_index(profiles)
+        username = self._name_index.get(search_lower)
+        if username and username in profiles:
+            return True, profiles[username], username
         
         # Try username variations
-        username_variations = self._generate_username_variations(search_term)
-        for variation in username_variations:
-            cached_data = get_profile_from_cache(variation)
+        for variation in _username_variations(search_lower):
+            cached_data = profiles.get(variation)
             if cached_data:
                 return True, cached_data, variation
         
+        # Fuzzy name match over the indexed names
+        if fuzz_process is not None:
+            username = _unambiguous_fuzzy_match(search_lower, self._name_choices, self._name_owners)
+            if username and username in profiles:
+                return True, profiles[username], username
+            return False, None, ""
+        
         # Search by name in all profiles with fuzzy matching
         try:
-            db = get_database()
-            profiles = db.get("profiles", {})
-            
-            search_lower = search_term.lower()
-            
-            for username, profile_data in profiles.items():
-                basic_info = profile_data.get("basic_info", {})
-                stored_name = basic_info.get("name", "").lower()
-                stored_full_name = basic_info.get("full_name", "").lower()
-                
-                # Exact match
-                if search_lower == stored_name or search_lower == stored_full_name:
-                    return True, profile_data, username
+            for i, username in enumerate(self._main_usernames):
+                stored_name = self._main_names_lower[i]
+                stored_full_name = self._main_fullnames_lower[i]
                 
-                # Fuzzy match (contains)
-                if stored_name and (search_lower in stored_name or stored_name in search_lower):
-                    return True, profile_data, username
-                
-                if stored_full_name and (search_lower in stored_full_name or stored_full_name in search_lower):
-                    return True, profile_data, username
-                
-                # Check if any word matches
-                search_words = search_lower.split()
-                name_words = stored_name.split() + stored_full_name.split()
-                if len(search_words) > 1 and any(word in name_words for word in search_words if len(word) > 2):
-                    return True, profile_data, username
+                if (
+                    # Fuzzy match (contains)
+                    (stored_name and (search_lower in stored_name or stored_name in search_lower))
+                    or (stored_full_name and (search_lower in stored_full_name or stored_full_name in search_lower))
+                    # Check if any word matches
+                    or (search_words_set and not search_words_set.isdisjoint(self._main_name_word_sets[i]))
+                ) and username in profiles:
+                    return True, profiles[username], username
         
         except Exception as e:
-            print(f"Main DB search error: {e}")
+            logger.warning("Main DB search error: %s", e)
         
         return False, None, ""
     
@@ -659,67 +900,43 @@ Confidence: [number between 0 and 1]
         if not self.embeddings_loaded or not fast_semantic_matcher.is_loaded:
             return False, None, ""
         
-        search_lower = search_term.lower()
-        username_variations = self._generate_username_variations(search_term)
+        search_lower, search_words, search_words_set = _normalize_search_term(search_term)
         
-        for username, influencer_data in fast_semantic_matcher.influencer_data.items():
-            stored_name = influencer_data.get('name', '').lower()
-            username_lower = username.lower()
-            
-            # Direct username match
-            if username_lower == search_lower:
-                converted_data = self._convert_embeddings_to_main_format(influencer_data, username)
-                return True, converted_data, username
-            
-            # Username variations match
-            if username_lower in [v.lower() for v in username_variations]:
-                converted_data = self._convert_embeddings_to_main_format(influencer_data, username)
-                return True, converted_data, username
-            
-            # Name fuzzy matching
-            if stored_name:
-                # Exact match
-                if search_lower == stored_name:
-                    converted_data = self._convert_embeddings_to_main_format(influencer_data, username)
-                    return True, converted_data, username
-                
-                # Contains match
-                if search_lower in stored_name or stored_name in search_lower:
-                    converted_data = self._convert_embeddings_to_main_format(influencer_data, username)
-                    return True, converted_data, username
-                
+        username = self._lookup_embeddings_index(search_lower, search_words)
+        if username:
+            influencer_data = fast_semantic_matcher.influencer_data[username]
+            return True, self._convert_embeddings_to_main_format(influencer_data, username), username
+        
+        # Username exact/variation hits were resolved by the index; match names only
+        if fuzz_process is not None:
+            username = _unambiguous_fuzzy_match(search_lower, self._emb_names_lower, self._emb_usernames)
+            if username is None:
+                return False, None, ""
+            influencer_data = fast_semantic_matcher.influencer_data[username]
+            return True, self._convert_embeddings_to_main_format(influencer_data, username), username
+        
+        for i, stored_name in enumerate(self._emb_names_lower):
+            if not stored_name:
+                continue
+            if (
+                # Contains match (covers exact)
+                search_lower in stored_name or stored_name in search_lower
                 # Word-level matching
-                search_words = search_lower.split()
-                name_words = stored_name.split()
-                if len(search_words) > 1 and any(word in name_words for word in search_words if len(word) > 2):
-                    converted_data = self._convert_embeddings_to_main_format(influencer_data, username)
-                    return True, converted_data, username
+                or (search_words_set and not search_words_set.isdisjoint(self._emb_name_word_sets[i]))
+            ):
+                username = self._emb_usernames[i]
+                influencer_data = fast_semantic_matcher.influencer_data[username]
+                return True, self._convert_embeddings_to_main_format(influencer_data, username), username
         
         return False, None, ""
     
-    def _generate_username_variations(self, name: str) -> List[str]:
-        """Generate common username variations"""
-        name_clean = name.lower().strip()
-        variations = [
-            name_clean.replace(" ", ""),
-            name_clean.replace(" ", "."),
-            name_clean.replace(" ", "_"),
-            name_clean.replace(" ", "") + "22",
-            name_clean.replace(" ", "") + "official",
-            name_clean.replace(" ", "") + "real",
-            "official" + name_clean.replace(" ", ""),
-            "real" + name_clean.replace(" ", ""),
-            name_clean.replace(" ", "") + "vlogs",
-            name_clean.replace(" ", "") + "youtube"
-        ]
-        
-        # Remove duplicates and return unique variations
-        return list(dict.fromkeys(variations))
-    
     def _convert_embeddings_to_main_format(self, embeddings_data: Dict, username: str) -> Dict:
-        """Convert embeddings format to main database format"""
+        """Convert embeddings format to main database format (memoized per username; callers only read it)"""
+        cached = self._converted_cache.get(username)
+        if cached is not None:
+            return cached
         
-        return {
+        converted = self._converted_cache[username] = {
             "basic_info": {
                 "username": username,
                 "name": embeddings_data.get('name', 'Unknown'),
@@ -775,6 +992,7 @@ Confidence: [number between 0 and 1]
                 "spelling_corrected": True
             }
         }
+        return converted
     
     def get_database_stats(self) -> Dict:
         """Get combined statistics from both databases"""
@@ -804,7 +1022,7 @@ Confidence: [number between 0 and 1]
     def toggle_auto_scraping(self, enabled: bool):
         """Toggle auto-scraping functionality"""
         self.auto_scraping_enabled = enabled
-        print(f"🕷️ Auto-scraping {'enabled' if enabled else 'disabled'}")
+        logger.info("🕷️ Auto-scraping %s", 'enabled' if enabled else 'disabled')
 
 
 # Global instance
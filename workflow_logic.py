@@ -1,27 +1,59 @@
 import re
+import math
 import json
-from urllib.parse import urlparse
 from datetime import datetime
-import statistics
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_IG_URL_RE = re.compile(r"^https?://(?:[^/]*\.)?instagram\.com/([a-z0-9._]+)/?$", re.IGNORECASE)
+_SCHEME_RE = re.compile(r"^https?://", re.IGNORECASE)
+_IG_USER_RE = re.compile(r"instagram\.com/([^/?#]+)", re.IGNORECASE)
 
 def safe_get_int(data, key, default=0):
     """Safely extract integer values from data."""
+    value = data.get(key, default)
+    # Apify JSON already holds ints; skip the conversion for them
+    if type(value) is int:
+        return value
+    if value is None:
+        return default
     try:
-        value = data.get(key, default)
-        return int(value) if value is not None else default
+        return int(value)
     except (ValueError, TypeError):
         return default
 
 def safe_get_float(data, key, default=0.0):
     """Safely extract float values from data."""
+    value = data.get(key, default)
+    if type(value) is float:
+        return value
+    if value is None:
+        return default
     try:
-        value = data.get(key, default)
-        return float(value) if value is not None else default
+        return float(value)
     except (ValueError, TypeError):
         return default
 
+def _comment_likes(comment):
+    """likesCount of a comment; ints are used as-is, anything else goes through safe_get_int."""
+    likes = comment.get('likesCount')
+    return likes if type(likes) is int else safe_get_int(comment, 'likesCount', 0)
+
+def _timestamp_or_nan(timestamp_str):
+    """Unix seconds for a post timestamp, NaN when it cannot be parsed."""
+    timestamp_obj = safe_parse_timestamp(timestamp_str)
+    return timestamp_obj.timestamp() if timestamp_obj else np.nan
+
+@lru_cache(maxsize=8192)
 def safe_parse_timestamp(timestamp_str):
-    """Safely parse timestamp strings into datetime objects."""
+    """Safely parse timestamp strings into datetime objects (memoized; datetimes are immutable)."""
     if not timestamp_str:
         return None
     
@@ -42,9 +74,9 @@ def build_search_query_and_filter_candidates(norm_data, fallback_query, search_r
     aliases = norm_data.get('aliases', []) or []
     handles = norm_data.get('handles', []) or []
     
-    terms = list(dict.fromkeys([
-        term for term in [search_name, *aliases, *handles] if term and term.strip()
-    ]))
+    terms = list(dict.fromkeys(
+        term.strip() for term in chain((search_name,), aliases, handles) if term and term.strip()
+    ))
     
     search_query = ' OR '.join(terms) if terms else fallback_query
     
@@ -58,18 +90,11 @@ def build_search_query_and_filter_candidates(norm_data, fallback_query, search_r
             if not url:
                 continue
                 
-            parsed_url = urlparse(url)
-            
-            if not parsed_url.hostname or 'instagram.com' not in parsed_url.hostname:
-                continue
-            
-            path_segments = [seg for seg in parsed_url.path.split('/') if seg]
-            if len(path_segments) != 1:
-                continue
-            
-            user = path_segments[0]
-            if not re.match(r"^[a-z0-9._]+$", user, re.IGNORECASE):
+            # Host check, single path segment and username charset in one match
+            m = _IG_URL_RE.match(url)
+            if not m:
                 continue
+            user = m.group(1)
                 
             if user.lower() in seen:
                 continue
@@ -103,12 +128,12 @@ def format_profile_data(selected_profile, original_query):
     username = None
     
     if url:
-        if not re.match(r"^https?:\/\/", url, re.IGNORECASE):
+        if not _SCHEME_RE.match(url):
             url = 'https://' + url.lstrip('/')
         if not url.endswith('/'):
             url += '/'
         
-        match = re.search(r"instagram\.com\/([^\/?#]+)", url, re.IGNORECASE)
+        match = _IG_USER_RE.search(url)
         if match:
             username = match.group(1)
     
@@ -137,13 +162,11 @@ def analyze_instagram_posts(posts_data, username):
             
             if latest_comments and isinstance(latest_comments, list):
                 try:
-                    best_comment = max(latest_comments, 
-                                     key=lambda c: safe_get_int(c, 'likesCount', 0), 
-                                     default=None)
+                    best_comment = max(latest_comments, key=_comment_likes, default=None)
                     if best_comment:
                         top_comment = {
                             "text": best_comment.get('text', ''),
-                            "likes": safe_get_int(best_comment, 'likesCount', 0)
+                            "likes": _comment_likes(best_comment)
                         }
                 except Exception as e:
                     print(f"Error processing comments: {e}")
@@ -165,6 +188,16 @@ def analyze_instagram_posts(posts_data, username):
             caption = post.get('caption', '') or post.get('text', '') or "No caption"
             topic = caption.split('\n')[0][:100]
             
+            # Typed Apify counts skip the safe_get_int call entirely
+            likes = post.get('likesCount', 0)
+            likes = likes if type(likes) is int else safe_get_int(post, 'likesCount', 0)
+            comments = post.get('commentsCount', 0)
+            comments = comments if type(comments) is int else safe_get_int(post, 'commentsCount', 0)
+            video_views = post.get('videoViewCount', 0)
+            video_views = video_views if type(video_views) is int else safe_get_int(post, 'videoViewCount', 0)
+            video_plays = post.get('videoPlayCount', 0)
+            video_plays = video_plays if type(video_plays) is int else safe_get_int(post, 'videoPlayCount', 0)
+            
             post_data = {
                 "username": username,
                 "ownerUsername": post.get('ownerUsername', username),
@@ -173,10 +206,10 @@ def analyze_instagram_posts(posts_data, username):
                 "postUrl": post.get('url', ''),
                 "timestamp": post.get('timestamp', datetime.now().isoformat()),
                 "topic": topic,
-                "likesCount": safe_get_int(post, 'likesCount', 0),
-                "commentsCount": safe_get_int(post, 'commentsCount', 0),
-                "videoViewCount": safe_get_int(post, 'videoViewCount', 0),
-                "videoPlayCount": safe_get_int(post, 'videoPlayCount', 0),
+                "likesCount": likes,
+                "commentsCount": comments,
+                "videoViewCount": video_views,
+                "videoPlayCount": video_plays,
                 "topComment": top_comment,
                 "isAd": is_ad,
                 "mentions": mentions,
@@ -192,6 +225,72 @@ def analyze_instagram_posts(posts_data, username):
     print(f"Successfully analyzed {len(results)} posts out of {len(posts_data)} total posts.")
     return results
 
+def _reduce_posts_numpy(likes, comments, views, is_ad):
+    """Engagement averages, ER stdev, totals and organic count over the post columns."""
+    interactions = (likes + comments).astype(np.float64)
+    er = np.where(views > 0, interactions / np.maximum(views, 1), interactions / np.maximum(likes, 1))
+    
+    # Fused reductions: counts, sums and sum of squares instead of three masked copies
+    positive = er > 0
+    er_pos = np.where(positive, er, 0.0)
+    n_pos = int(np.count_nonzero(positive))
+    n_spon = int(np.count_nonzero(positive & is_ad))
+    n_org = n_pos - n_spon
+    s_er = float(er_pos.sum())
+    s_er_spon = float(er_pos[is_ad].sum())
+    s_er_org = s_er - s_er_spon
+    sq_er = float(np.dot(er_pos, er_pos))
+    
+    stdev_er = math.sqrt(max(0.0, (sq_er - s_er * s_er / n_pos) / (n_pos - 1))) if n_pos > 1 else 0.0
+    return (
+        s_er / n_pos if n_pos else 0.0,
+        s_er_org / n_org if n_org else 0.0,
+        s_er_spon / n_spon if n_spon else 0.0,
+        stdev_er,
+        likes.sum(), comments.sum(), views.sum(),
+        n_org,
+    )
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _reduce_posts(likes, comments, views, is_ad):
+        """Same as _reduce_posts_numpy, compiled to a single indexed loop."""
+        n_pos = n_org = n_spon = 0
+        s_er = s_er_org = s_er_spon = sq_er = 0.0
+        s_likes = s_comments = s_views = 0
+        for i in range(likes.shape[0]):
+            s_likes += likes[i]
+            s_comments += comments[i]
+            s_views += views[i]
+            interactions = float(likes[i] + comments[i])
+            if views[i] > 0:
+                er = interactions / views[i]
+            else:
+                er = interactions / max(likes[i], 1)
+            if er > 0:
+                n_pos += 1
+                s_er += er
+                sq_er += er * er
+                if is_ad[i]:
+                    n_spon += 1
+                    s_er_spon += er
+                else:
+                    n_org += 1
+                    s_er_org += er
+        stdev_er = 0.0
+        if n_pos > 1:
+            stdev_er = math.sqrt(max(0.0, (sq_er - s_er * s_er / n_pos) / (n_pos - 1)))
+        return (
+            s_er / n_pos if n_pos else 0.0,
+            s_er_org / n_org if n_org else 0.0,
+            s_er_spon / n_spon if n_spon else 0.0,
+            stdev_er,
+            s_likes, s_comments, s_views,
+            n_org,
+        )
+else:
+    _reduce_posts = _reduce_posts_numpy
+
 def aggregate_post_metrics(posts):
     """Aggregates metrics from analyzed posts."""
     if not posts:
@@ -199,69 +298,47 @@ def aggregate_post_metrics(posts):
         return {}
     
     try:
-        analyzed_posts = []
-        
-        for p in posts:
-            likes = p.get('likesCount', 0)
-            comments = p.get('commentsCount', 0)
-            views = max(p.get('videoViewCount', 0), p.get('videoPlayCount', 0))
-            
-            er = (likes + comments) / views if views > 0 else (likes + comments) / max(likes, 1)
-            
-            timestamp_obj = safe_parse_timestamp(p.get('timestamp'))
-            timestamp_unix = timestamp_obj.timestamp() if timestamp_obj else None
-            
-            analyzed_posts.append({
-                "likes": likes,
-                "comments": comments,
-                "views": views,
-                "er": er,
-                "isAd": p.get('isAd', False),
-                "hashtags": p.get('hashtags', []),
-                "mentions": p.get('mentions', []),
-                "ts": timestamp_unix
-            })
+        n = len(posts)
+        # One pass into column arrays; the reductions run in _reduce_posts
+        likes = np.fromiter((p.get('likesCount', 0) for p in posts), dtype=np.int64, count=n)
+        comments = np.fromiter((p.get('commentsCount', 0) for p in posts), dtype=np.int64, count=n)
+        views = np.maximum(
+            np.fromiter((p.get('videoViewCount', 0) for p in posts), dtype=np.int64, count=n),
+            np.fromiter((p.get('videoPlayCount', 0) for p in posts), dtype=np.int64, count=n)
+        )
+        is_ad = np.fromiter((bool(p.get('isAd', False)) for p in posts), dtype=np.bool_, count=n)
+        ts = np.fromiter((_timestamp_or_nan(p.get('timestamp')) for p in posts), dtype=np.float64, count=n)
         
-        ers = [p['er'] for p in analyzed_posts if p['er'] > 0]
-        ers_org = [p['er'] for p in analyzed_posts if not p['isAd'] and p['er'] > 0]
-        ers_spon = [p['er'] for p in analyzed_posts if p['isAd'] and p['er'] > 0]
-        
-        stdev_er = statistics.stdev(ers) if len(ers) > 1 else 0
+        avg_all, avg_org, avg_spon, stdev_er, total_likes, total_comments, total_views, n_org = _reduce_posts(
+            likes, comments, views, is_ad
+        )
+        total_likes, total_comments, total_views, n_org = int(total_likes), int(total_comments), int(total_views), int(n_org)
         consistency_score = max(0, min(85, 100 - (stdev_er * 10)))
         
-        timestamps = sorted([p['ts'] for p in analyzed_posts if p['ts']])
+        timestamps = np.sort(ts[~np.isnan(ts) & (ts != 0)])
         avg_days_between = None
         if len(timestamps) > 1:
-            diffs = [(timestamps[i] - timestamps[i-1]) / (24 * 3600) for i in range(1, len(timestamps))]
-            avg_days_between = statistics.mean(diffs)
-        
-        total_likes = sum(p['likes'] for p in analyzed_posts)
-        total_comments = sum(p['comments'] for p in analyzed_posts)
-        total_views = sum(p['views'] for p in analyzed_posts)
+            avg_days_between = float(np.diff(timestamps).mean() / (24 * 3600))
         
-        hashtag_counts = {}
-        for p in analyzed_posts:
-            for h in p.get('hashtags', []):
-                if isinstance(h, str):
-                    hashtag_counts[h] = hashtag_counts.get(h, 0) + 1
+        hashtag_counts = Counter(h for p in posts for h in p.get('hashtags', ()) if isinstance(h, str))
         
         metrics = {
             "username": posts[0].get('username', ''),
             "postsAnalyzed": len(posts),
-            "avgEngagement_all": statistics.mean(ers) if ers else 0,
-            "avgEngagement_organic": statistics.mean(ers_org) if ers_org else 0,
-            "avgEngagement_sponsored": statistics.mean(ers_spon) if ers_spon else 0,
-            "avgLikes": statistics.mean([p['likes'] for p in analyzed_posts]) if analyzed_posts else 0,
-            "avgComments": statistics.mean([p['comments'] for p in analyzed_posts]) if analyzed_posts else 0,
-            "avgViews": statistics.mean([p['views'] for p in analyzed_posts]) if analyzed_posts else 0,
+            "avgEngagement_all": avg_all,
+            "avgEngagement_organic": avg_org,
+            "avgEngagement_sponsored": avg_spon,
+            "avgLikes": total_likes / n,
+            "avgComments": total_comments / n,
+            "avgViews": total_views / n,
             "stdevEngagement": stdev_er,
             "consistencyScore": consistency_score,
-            "organicPct": (len(ers_org) / len(posts)) * 100 if posts else 0,
+            "organicPct": (n_org / n) * 100,
             "postingAvgDays": avg_days_between,
             "commentShare": total_comments / (total_likes + total_comments) if (total_likes + total_comments) > 0 else 0,
             "commentsPer10kViews": (total_comments / total_views) * 10000 if total_views > 0 else 0,
             "adDisclosurePct": 100,
-            "hashtagCounts": hashtag_counts,
+            "hashtagCounts": dict(hashtag_counts),
         }
         
         print(f"Aggregated metrics for {len(posts)} posts successfully.")
@@ -328,6 +405,13 @@ def calculate_scores_manually(metrics, username):
             "ContentQuality": 65.0,
         }
 
+def analyze_and_score_posts(posts_data, username):
+    """Runs post analysis, aggregation and scoring in one call (one worker round trip)."""
+    analyzed_posts = analyze_instagram_posts(posts_data, username)
+    metrics = aggregate_post_metrics(analyzed_posts)
+    scores = calculate_scores_manually(metrics, username)
+    return analyzed_posts, metrics, scores
+
 def format_final_report(ai_scores, metrics):
     """Flattens the final AI response for database insertion."""
     try: